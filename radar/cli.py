@@ -344,8 +344,7 @@ def synth(
     console.print(f"  After scoring: {len(scored)} posts ranked")
 
     if not dry_run:
-        for post in scored:
-            db.upsert_post(post)
+        db.upsert_posts(scored)
 
     top5 = pipeline.backfill.ensure_five(scored)
 
@@ -370,11 +369,15 @@ def synth(
     if not dry_run:
         today_str = datetime.utcnow().strftime("%Y-%m-%d")
         report_id = db.create_report("daily", today_str)
-        for rank, post in enumerate(top5, start=1):
-            post_db_id = db.upsert_post(post)
-            if post_db_id is not None:
-                db.add_report_entry(report_id, post_db_id, rank, post.source_tier or "live")
-                db.mark_reported(post_db_id)
+        post_db_ids = db.upsert_posts(top5)
+        entries = [
+            (post_db_id, rank, post.source_tier or "live")
+            for rank, (post, post_db_id) in enumerate(zip(top5, post_db_ids), start=1)
+            if post_db_id is not None
+        ]
+        db.add_report_entries(report_id, entries)
+        for post_db_id, _, _ in entries:
+            db.mark_reported(post_db_id)
         console.print(f"  Stored report #{report_id} with {len(top5)} entries")
 
     if pipeline.email_sender and cfg.email_enabled and not no_email:
@@ -6,6 +6,7 @@ Delivery ladder: SMTP → local sendmail binary (zero-config fallback).
 from __future__ import annotations
 
 import logging
+import re
 import shutil
 import smtplib
 import subprocess
@@ -29,6 +30,17 @@ logger = logging.getLogger(__name__)
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Plain-text fallback helpers; entities are replaced in this order.
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_ENTITIES = (
+    ("&nbsp;", " "),
+    ("&amp;", "&"),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+)
+
 
 class EmailSender:
     """Renders Jinja2 templates and dispatches email.
@@ -169,13 +181,8 @@ class EmailSender:
     @staticmethod
     def _plaintext_fallback(html: str) -> str:
         """Strip HTML tags to produce a plain-text fallback."""
-        import re
-
-        text = re.sub(r"<[^>]+>", "", html)
-        text = re.sub(r"&nbsp;", " ", text)
-        text = re.sub(r"&amp;", "&", text)
-        text = re.sub(r"&lt;", "<", text)
-        text = re.sub(r"&gt;", ">", text)
-        text = re.sub(r"&quot;", '"', text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _TAG_RE.sub("", html)
+        for entity, char in _ENTITIES:
+            text = text.replace(entity, char)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         return text.strip()
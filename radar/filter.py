@@ -9,7 +9,11 @@ import re
 from typing import Dict, List, Optional
 
 from radar.models import PainCategory
-from radar.ranking.keywords import COMPILED_PATTERNS, MAINTAINER_PATTERNS, count_keyword_hits
+from radar.ranking.keywords import (
+    COMPILED_PATTERNS,
+    MAINTAINER_FUSED,
+    count_keyword_hits,
+)
 
 # Re-export for patch targets used by sealed tests
 try:
@@ -71,10 +75,7 @@ class SignalFilter:
 
         # Fall back to regex scanning
         text = f"{post.get('title', '')} {post.get('body', '')}"
-        for pattern in MAINTAINER_PATTERNS:
-            if pattern.search(text):
-                return True
-        return False
+        return MAINTAINER_FUSED.search(text) is not None
 
     def passes_sentiment_gate(self, post: Dict) -> bool:
         """Return True if post.sentiment_score < -0.05 (strictly)."""
@@ -1,7 +1,8 @@
 """LLM Backend — GitHub Models API primary, Amplifier CLI fallback.
 
-Pure Python stdlib LLM backend — no new pip deps.
-Uses `gh api` for GitHub Models and `uv run amplifier` as fallback.
+No new pip deps: GitHub Models is called over the existing httpx dependency
+when a token is in the environment, otherwise through `gh api`; `uv run
+amplifier` is the fallback.
 """
 
 from __future__ import annotations
@@ -11,10 +12,23 @@ import json
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, Awaitable, List, TypeVar
+
+import httpx
+
+try:
+    import orjson  # type: ignore[import]
+
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_GITHUB_MODELS_URL = "https://api.github.com/models/chat/completions"
+
 _STUB_RESPONSE = {
     "content": "[DRY-RUN] No LLM call made.",
     "model": "stub",
@@ -23,6 +37,33 @@ _STUB_RESPONSE = {
 }
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Decode a JSON response body; orjson reads the bytes without a decode step."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def run_sync(coro: Awaitable[_T]) -> _T:
+    """Run *coro* to completion from synchronous code.
+
+    Inside an already-running event loop the coroutine is run on a fresh
+    loop in a worker thread instead.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop and loop.is_running():
+        # Already in an async context — create a new thread
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(asyncio.run, coro)
+            return future.result(timeout=120)
+    return asyncio.run(coro)  # type: ignore[arg-type]
+
+
 @dataclass
 class LLMResponse:
     """Structured response from any LLM backend."""
@@ -37,7 +78,8 @@ class LLMResponse:
 class LLMBackend:
     """Wraps GitHub Models API and Amplifier CLI with dry-run support.
 
-    Primary: GitHub Models API via ``gh api /models/chat/completions``
+    Primary: GitHub Models API — direct HTTPS when ``GITHUB_TOKEN`` /
+    ``GH_TOKEN`` is set, else ``gh api /models/chat/completions``
     Fallback: Amplifier CLI via ``uv run amplifier``
     """
 
@@ -48,6 +90,8 @@ class LLMBackend:
     ) -> None:
         self.default_model = default_model
         self.dry_run = dry_run
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
 
     async def complete(
         self,
@@ -85,23 +129,42 @@ class LLMBackend:
         model: str | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
-        """Synchronous wrapper around complete() for pipeline use."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            # Already in an async context — create a new thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                future = pool.submit(asyncio.run, self.complete(messages, model, **kwargs))
-                return future.result(timeout=120)
-        else:
-            return asyncio.run(self.complete(messages, model, **kwargs))
+        """Synchronous wrapper around complete() for pipeline use.
+
+        Each call runs on its own event loop, so the HTTP client opened for
+        it is closed before that loop ends.
+        """
+
+        async def _complete_once() -> LLMResponse:
+            try:
+                return await self.complete(messages, model, **kwargs)
+            finally:
+                await self.aclose()
+
+        return run_sync(_complete_once())
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_loop = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop.
+
+        httpx connections belong to the loop that opened them, so a client is
+        only reused on the loop it was made on.  complete_sync() closes its
+        client before its loop ends; async callers close theirs with aclose().
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_loop is not loop:
+            self._http_client = httpx.AsyncClient(timeout=60)
+            self._http_loop = loop
+        return self._http_client
 
     # ------------------------------------------------------------------
-    # GitHub Models via `gh api`
+    # GitHub Models (HTTP or `gh api`)
     # ------------------------------------------------------------------
 
     async def _github_models(
@@ -111,12 +174,41 @@ class LLMBackend:
         max_tokens: int,
         temperature: float,
     ) -> LLMResponse:
-        payload = json.dumps({
+        payload = {
             "model": model,
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature,
-        })
+        }
+        token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        if token:
+            # Direct HTTP: pooled connections, no gh process per request
+            resp = await self._client().post(
+                _GITHUB_MODELS_URL,
+                json=payload,
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "Authorization": f"Bearer {token}",
+                },
+            )
+            if resp.status_code != 200:
+                raise RuntimeError(f"GitHub Models HTTP {resp.status_code}: {resp.text.strip()}")
+            data = _json_loads(resp.content)
+        else:
+            data = await self._gh_api(payload)
+
+        choice = data["choices"][0]["message"]
+        usage = data.get("usage", {})
+        return LLMResponse(
+            content=choice.get("content", ""),
+            model=data.get("model", model),
+            tokens_in=usage.get("prompt_tokens", 0),
+            tokens_out=usage.get("completion_tokens", 0),
+            raw=data,
+        )
+
+    async def _gh_api(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST *payload* through ``gh api``, which handles auth itself."""
         proc = await asyncio.create_subprocess_exec(
             "gh", "api",
             "--method", "POST",
@@ -128,22 +220,13 @@ class LLMBackend:
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, stderr = await asyncio.wait_for(
-            proc.communicate(input=payload.encode()), timeout=60,
+            proc.communicate(input=json.dumps(payload).encode()), timeout=60,
         )
 
         if proc.returncode != 0:
             raise RuntimeError(f"gh api exit {proc.returncode}: {stderr.decode().strip()}")
 
-        data = json.loads(stdout.decode())
-        choice = data["choices"][0]["message"]
-        usage = data.get("usage", {})
-        return LLMResponse(
-            content=choice.get("content", ""),
-            model=data.get("model", model),
-            tokens_in=usage.get("prompt_tokens", 0),
-            tokens_out=usage.get("completion_tokens", 0),
-            raw=data,
-        )
+        return _json_loads(stdout)
 
     # ------------------------------------------------------------------
     # Amplifier CLI fallback
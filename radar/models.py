@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -30,10 +30,35 @@ class PainCategory(str, Enum):
     CI_CD = "ci_cd"
 
 
+# The ASCII characters str.strip() removes.  bytes.strip() alone skips the
+# \x1c-\x1f separators, which would change the hash of such URLs.
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def _normalise_url(url: str) -> bytes:
+    """Return the dedup form of *url*: trimmed, lower-cased, no trailing slash.
+
+    ASCII URLs (effectively all of them) are normalised in a single bytes pass;
+    anything else goes through ``str.lower()`` so Unicode case folding is unchanged.
+    """
+    if url.isascii():
+        return url.encode().strip(_ASCII_WHITESPACE).rstrip(b"/").lower()
+    return url.strip().lower().rstrip("/").encode()
+
+
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 def _sha256_url(url: str) -> str:
-    """Return SHA-256 hex digest of a normalised URL string."""
-    normalised = url.strip().lower().rstrip("/")
-    return hashlib.sha256(normalised.encode()).hexdigest()
+    """Return SHA-256 hex digest of a normalised URL string.
+
+    The digest is persisted as ``posts.url_hash`` and is the dedup key across
+    runs, so the algorithm must stay stable: switching to a faster hash would
+    orphan every stored key and let already-reported posts re-enter the catalog.
+    """
+    return hashlib.sha256(_normalise_url(url)).hexdigest()
 
 
 class RawPost(BaseModel):
@@ -60,7 +85,7 @@ class RawPost(BaseModel):
     raw_sentiment: float = 0.0  # alias for sentiment
     is_maintainer: bool = False
     is_maintainer_context: bool = False  # alias
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: datetime = Field(default_factory=_utcnow)
     created_utc: Optional[datetime] = None
     # Fallback ladder provenance
     source_tier: str = "live"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
@@ -14,7 +15,7 @@ from radar.ranking.scorer import SignalScorer
 from radar.scraping.base import BaseScraper
 from radar.scraping.devto import DevToScraper
 from radar.scraping.hackernews import HNScraper
-from radar.scraping.http import SafeHTTPClient
+from radar.scraping.http import get_default_client
 from radar.scraping.lobsters import LobstersScraper
 from radar.scraping.reddit import RedditScraper
 from radar.storage.database import Database
@@ -53,48 +54,39 @@ class BackfillManager:
                 p.backfill_source = "live"
             return result[:self.TARGET]
 
-        # Rung 2 — archive-7d
-        if len(result) < self.TARGET:
-            needed = self.TARGET - len(result)
-            archive_7 = self._from_archive(days=7, needed=needed)
-            for p in archive_7:
-                p.source_tier = "archive-7d"
-                p.provenance = "archive-7d"
-                p.backfill_source = "archive-7d"
-            result.extend(archive_7)
-
-        if len(result) >= self.TARGET:
-            return result[:self.TARGET]
-
-        # Rung 3 — archive-30d
-        needed = self.TARGET - len(result)
-        archive_30 = self._from_archive(days=30, needed=needed)
+        # Rungs 2 + 3 — archive-7d, then archive-30d, from a single query.
+        # Live posts are already stored (unreported), so skip them by hash.
         existing_hashes = {p.url_hash for p in result}
-        for p in archive_30:
-            if p.url_hash not in existing_hashes:
-                p.source_tier = "archive-30d"
-                p.provenance = "archive-30d"
-                p.backfill_source = "archive-30d"
-                result.append(p)
-                existing_hashes.add(p.url_hash)
-                if len(result) >= self.TARGET:
-                    break
-
-        if len(result) >= self.TARGET:
-            return result[:self.TARGET]
+        candidates = self.db.fetch_archive_tiered(
+            recent_days=7,
+            days=30,
+            limit=self.TARGET - len(result) + len(existing_hashes),
+        )
+        for is_recent, p in candidates:
+            if p.url_hash in existing_hashes:
+                continue
+            tier = "archive-7d" if is_recent else "archive-30d"
+            p.source_tier = tier
+            p.provenance = tier
+            p.backfill_source = tier
+            result.append(p)
+            existing_hashes.add(p.url_hash)
+            if len(result) >= self.TARGET:
+                return result
 
         # Rung 4 — partial (mark all remaining)
-        all_posts = self.db.fetch_all_unreported(limit=50)
-        existing_hashes = {p.url_hash for p in result}
-        for p in all_posts:
-            if p.url_hash not in existing_hashes:
-                p.source_tier = "partial"
-                p.provenance = "partial"
-                p.backfill_source = "partial"
-                result.append(p)
-                existing_hashes.add(p.url_hash)
-                if len(result) >= self.TARGET:
-                    break
+        # Pick survivors from (id, url_hash) first; hydrate only those rows.
+        needed = self.TARGET - len(result)
+        survivor_ids = [
+            post_id
+            for post_id, url_hash, _ in self.db.fetch_top_unreported_minimal(limit=50)
+            if url_hash not in existing_hashes
+        ][:needed]
+        for p in self.db.fetch_posts_by_ids(survivor_ids):
+            p.source_tier = "partial"
+            p.provenance = "partial"
+            p.backfill_source = "partial"
+            result.append(p)
 
         # Mark as partial if still under target
         for p in result:
@@ -104,10 +96,6 @@ class BackfillManager:
 
         return result
 
-    def _from_archive(self, days: int, needed: int) -> List[ScoredPost]:
-        """Fetch unreported posts from the last *days* days, up to *needed*."""
-        return self.db.fetch_archive(days=days, limit=needed * 2)[:needed]
-
 
 class PipelineOrchestrator:
     """Coordinates the full scrape → filter → rank → backfill → store → email flow."""
@@ -121,10 +109,7 @@ class PipelineOrchestrator:
     ) -> None:
         self.config = config
         self.db = db
-        self._client = SafeHTTPClient(
-            timeout=config.request_timeout,
-            max_retries=config.max_retries,
-        )
+        self._client = get_default_client(config)
         self.scrapers: List[BaseScraper] = scrapers or self._default_scrapers()
         self.filter_pipeline = FilterPipeline(
             vader_weight=config.sentiment_vader_weight,
@@ -155,10 +140,7 @@ class PipelineOrchestrator:
         logger.info("scrape_only.filtered", extra={"after_filter": len(filtered)})
 
         scored = self._rank(filtered)
-        stored = 0
-        for post in scored:
-            if self.db.upsert_post(post) is not None:
-                stored += 1
+        stored = sum(1 for post_id in self.db.upsert_posts(scored) if post_id is not None)
 
         logger.info("scrape_only.stored", extra={"stored": stored, "statuses": statuses})
         return stored
@@ -208,8 +190,7 @@ class PipelineOrchestrator:
 
         # 4. Backfill (inject live posts into DB first so archive can be used)
         if not dry_run:
-            for post in scored:
-                self.db.upsert_post(post)
+            self.db.upsert_posts(scored)
 
         posts_for_report = self.backfill.ensure_five(scored)
 
@@ -239,16 +220,15 @@ class PipelineOrchestrator:
 
         # 6. Persist report
         report_id = self.db.create_report("daily", today_str)
-        for rank, post in enumerate(posts_for_report, start=1):
-            post_db_id = self.db.upsert_post(post)
-            if post_db_id is not None:
-                self.db.add_report_entry(
-                    report_id=report_id,
-                    post_id=post_db_id,
-                    rank=rank,
-                    provenance=post.source_tier or "live",
-                )
-                self.db.mark_reported(post_db_id)
+        post_db_ids = self.db.upsert_posts(posts_for_report)
+        entries = [
+            (post_db_id, rank, post.source_tier or "live")
+            for rank, (post, post_db_id) in enumerate(zip(posts_for_report, post_db_ids), start=1)
+            if post_db_id is not None
+        ]
+        self.db.add_report_entries(report_id, entries)
+        for post_db_id, _, _ in entries:
+            self.db.mark_reported(post_db_id)
 
         # 7. Send email
         email_ok = True
@@ -315,21 +295,37 @@ class PipelineOrchestrator:
         return scrapers
 
     def _collect(self) -> tuple[List[RawPost], Dict[str, str]]:
-        """Run all scrapers; return (all_posts, platform_statuses)."""
+        """Run all scrapers concurrently; return (all_posts, platform_statuses).
+
+        Scraping is network-bound, so each scraper gets its own thread.
+        Results are merged in ``self.scrapers`` order, and a failing scraper
+        only marks its own platform as failed.
+        """
         all_posts: List[RawPost] = []
         statuses: Dict[str, str] = {}
 
-        for scraper in self.scrapers:
+        def _safe(scraper: BaseScraper) -> List[RawPost] | Exception:
             try:
-                posts = scraper.scrape()
-                all_posts.extend(posts)
-                statuses[scraper.platform] = "ok" if posts else "empty"
+                return scraper.scrape()
             except Exception as exc:
+                return exc
+
+        if not self.scrapers:
+            return all_posts, statuses
+
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as pool:
+            outcomes = list(pool.map(_safe, self.scrapers))
+
+        for scraper, posts in zip(self.scrapers, outcomes):
+            if isinstance(posts, Exception):
                 statuses[scraper.platform] = "failed"
                 logger.error(
                     "scraper_failed",
-                    extra={"platform": scraper.platform, "error": str(exc)},
+                    extra={"platform": scraper.platform, "error": str(posts)},
                 )
+                continue
+            all_posts.extend(posts)
+            statuses[scraper.platform] = "ok" if posts else "empty"
 
         return all_posts, statuses
 
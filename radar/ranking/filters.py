@@ -2,15 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import List
+from typing import Any, Iterable, Iterator, List, Optional
 
 from radar.models import PainCategory, RawPost
-from radar.ranking.keywords import (
-    COMPILED_PATTERNS,
-    MAINTAINER_PATTERNS,
-    count_keyword_hits,
-)
+from radar.ranking.keywords import MAINTAINER_FUSED, MAINTAINER_PATTERNS, count_keyword_hits
 
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer  # type: ignore[import]
@@ -19,12 +16,20 @@ try:
 except ImportError:  # pragma: no cover
     _VADER_AVAILABLE = False
 
-try:
-    from textblob import TextBlob  # type: ignore[import]
+@functools.lru_cache(maxsize=1)
+def _get_vader() -> object:
+    """Return the shared VADER analyzer (loading its lexicon is expensive)."""
+    return SentimentIntensityAnalyzer()
 
-    _TEXTBLOB_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    _TEXTBLOB_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
+def _get_textblob() -> Optional[Any]:
+    """Import TextBlob on first use (it pulls in NLTK); None if not installed."""
+    try:
+        from textblob import TextBlob  # type: ignore[import]
+    except ImportError:  # pragma: no cover
+        return None
+    return TextBlob
 
 
 class KeywordFilter:
@@ -33,20 +38,19 @@ class KeywordFilter:
     Populates ``post.pain_categories`` and ``post.pain_score`` as a side effect.
     """
 
-    def __init__(self) -> None:
-        self._patterns = COMPILED_PATTERNS
-
-    def apply(self, posts: List[RawPost]) -> List[RawPost]:
+    def apply(self, posts: Iterable[RawPost]) -> List[RawPost]:
         """Return posts that match at least one keyword; enrich with categories."""
-        passing: List[RawPost] = []
+        return list(self.iter_apply(posts))
+
+    def iter_apply(self, posts: Iterable[RawPost]) -> Iterator[RawPost]:
+        """Lazily yield the posts :meth:`apply` would return."""
         for post in posts:
             text = f"{post.title} {post.body}"
             hits = count_keyword_hits(text)
             if hits:
                 post.pain_categories = list(hits.keys())
                 post.pain_score = sum(hits.values())
-                passing.append(post)
-        return passing
+                yield post
 
     def _score_categories(self, text: str) -> dict[PainCategory, float]:
         """Return per-category weighted hit counts."""
@@ -57,24 +61,27 @@ class MaintainerContextFilter:
     """Layer 2: keep posts that contain ≥1 maintainer-context signal."""
 
     def __init__(self) -> None:
+        # Only count_signals uses the individual patterns; the pass/fail
+        # check in _is_maintainer goes through MAINTAINER_FUSED.
         self._patterns: List[re.Pattern[str]] = MAINTAINER_PATTERNS
 
-    def apply(self, posts: List[RawPost]) -> List[RawPost]:
+    def apply(self, posts: Iterable[RawPost]) -> List[RawPost]:
         """Return posts where the author demonstrates maintainer context."""
-        passing: List[RawPost] = []
+        return list(self.iter_apply(posts))
+
+    def iter_apply(self, posts: Iterable[RawPost]) -> Iterator[RawPost]:
+        """Lazily yield the posts :meth:`apply` would return."""
         for post in posts:
             if self._is_maintainer(post):
                 post.is_maintainer = True
                 post.is_maintainer_context = True
-                passing.append(post)
-        return passing
+                yield post
 
     def _is_maintainer(self, post: RawPost) -> bool:
         """Return True if post contains ≥1 maintainer-context pattern."""
         text = f"{post.title} {post.body}"
-        for pattern in self._patterns:
-            if pattern.search(text):
-                return True
+        if MAINTAINER_FUSED.search(text):
+            return True
         # Also check if author username appears in a GitHub URL within the post
         if post.author:
             github_pattern = re.compile(
@@ -87,6 +94,8 @@ class MaintainerContextFilter:
 
     def count_signals(self, text: str) -> int:
         """Return how many distinct maintainer signals are present."""
+        # One search of the fused alternation stops at the first signal, so
+        # counting distinct signals still needs a pass per pattern.
         count = 0
         for pattern in self._patterns:
             if pattern.search(text):
@@ -112,39 +121,55 @@ class SentimentFilter:
         self.textblob_weight = textblob_weight
         self._vader: object = None
         if _VADER_AVAILABLE:
-            self._vader = SentimentIntensityAnalyzer()  # type: ignore[assignment]
+            self._vader = _get_vader()
+
+    def apply(self, posts: Iterable[RawPost]) -> List[RawPost]:
+        """Return posts with combined sentiment < −0.05; store score on post.
+
+        TextBlob is skipped for posts whose VADER score alone rules them out:
+        even a polarity of −1 could not pull them under the threshold.  Those
+        rejected posts keep the VADER-only contribution as their score.
+        """
+        return list(self.iter_apply(posts))
 
-    def apply(self, posts: List[RawPost]) -> List[RawPost]:
-        """Return posts with combined sentiment < −0.05; store score on post."""
-        passing: List[RawPost] = []
+    def iter_apply(self, posts: Iterable[RawPost]) -> Iterator[RawPost]:
+        """Lazily yield the posts :meth:`apply` would return."""
         for post in posts:
             text = f"{post.title} {post.body}"
-            score = self._combined_score(text)
+            vader_part = self.vader_weight * self._vader_score(text)
+            if vader_part - self.textblob_weight >= self.PASS_THRESHOLD:
+                score = vader_part
+            else:
+                score = vader_part + self.textblob_weight * self._textblob_score(text)
             post.sentiment = score
             post.raw_sentiment = score
             if score < self.PASS_THRESHOLD:
-                passing.append(post)
-        return passing
+                yield post
 
     def _combined_score(self, text: str) -> float:
         """Return combined VADER+TextBlob sentiment score.
 
         Range is approximately [-1, +1].  Negative values indicate pain.
         """
-        vader_score = 0.0
-        textblob_score = 0.0
+        return (
+            self.vader_weight * self._vader_score(text)
+            + self.textblob_weight * self._textblob_score(text)
+        )
 
+    def _vader_score(self, text: str) -> float:
         if _VADER_AVAILABLE and self._vader is not None:
-            vs = self._vader.polarity_scores(text)  # type: ignore[attr-defined]
-            vader_score = vs["compound"]
-        if _TEXTBLOB_AVAILABLE:
-            try:
-                tb = TextBlob(text)
-                textblob_score = tb.sentiment.polarity
-            except Exception:
-                textblob_score = 0.0
+            return self._vader.polarity_scores(text)["compound"]  # type: ignore[attr-defined]
+        return 0.0
 
-        return self.vader_weight * vader_score + self.textblob_weight * textblob_score
+    @staticmethod
+    def _textblob_score(text: str) -> float:
+        text_blob = _get_textblob()
+        if text_blob is None:
+            return 0.0
+        try:
+            return text_blob(text).sentiment.polarity
+        except Exception:
+            return 0.0
 
 
 class FilterPipeline:
@@ -165,9 +190,12 @@ class FilterPipeline:
             textblob_weight=textblob_weight,
         )
 
-    def apply(self, posts: List[RawPost]) -> List[RawPost]:
-        """Run all three layers; return posts passing every layer."""
-        after_kw = self.keyword_filter.apply(posts)
-        after_mc = self.maintainer_filter.apply(after_kw)
-        after_sent = self.sentiment_filter.apply(after_mc)
-        return after_sent
+    def apply(self, posts: Iterable[RawPost]) -> List[RawPost]:
+        """Run all three layers; return posts passing every layer.
+
+        The layers are chained lazily, so each post runs through all three
+        before the next one starts and no intermediate lists are built.
+        """
+        after_kw = self.keyword_filter.iter_apply(posts)
+        after_mc = self.maintainer_filter.iter_apply(after_kw)
+        return list(self.sentiment_filter.iter_apply(after_mc))
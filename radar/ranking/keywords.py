@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Dict, List, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from radar.models import PainCategory
 
+try:
+    import hyperscan  # type: ignore[import]
+
+    _HYPERSCAN_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _HYPERSCAN_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # Each entry is (pattern_string, weight) where weight ∈ [1.0, 3.0]
 # ---------------------------------------------------------------------------
@@ -260,6 +269,70 @@ COMPILED_PATTERNS: Dict[PainCategory, List[Tuple[re.Pattern[str], float]]] = {
     for category, patterns in _RAW_PATTERNS.items()
 }
 
+# One alternation per category, used as a prefilter: a single C-level scan
+# rules out every category the text cannot match.  The per-pattern list is
+# still needed to sum weights, since alternation reports only one match.
+FUSED_PATTERNS: Dict[PainCategory, re.Pattern[str]] = {
+    category: re.compile(
+        "|".join(f"(?:{pattern})" for pattern, _ in patterns),
+        re.IGNORECASE | re.DOTALL,
+    )
+    for category, patterns in _RAW_PATTERNS.items()
+}
+
+# Optional Hyperscan backend: every keyword pattern in one database, matched
+# in a single pass over the text.  Hyperscan's \b and \s are ASCII-only (its
+# UCP mode rejects \b), so on non-ASCII text it can both over- and
+# under-report against Python's Unicode-aware ``re``: "burned\xa0out" would
+# be missed.  It is therefore used for ASCII text only, and each pattern it
+# reports is still confirmed with ``re``.
+_FLAT_PATTERNS: List[Tuple[PainCategory, re.Pattern[str], float]] = [
+    (category, pattern, weight)
+    for category, compiled in COMPILED_PATTERNS.items()
+    for pattern, weight in compiled
+]
+_hs_scratch = threading.local()
+
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_db() -> Optional["hyperscan.Database"]:
+    """Compile the keyword patterns for Hyperscan; None when unavailable."""
+    if not _HYPERSCAN_AVAILABLE:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[p.pattern.encode() for _, p, _ in _FLAT_PATTERNS],
+            ids=list(range(len(_FLAT_PATTERNS))),
+            elements=len(_FLAT_PATTERNS),
+            flags=[flags] * len(_FLAT_PATTERNS),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _hyperscan_hits(db: "hyperscan.Database", text: str) -> Dict[PainCategory, float]:
+    # *text* must be ASCII (see count_keyword_hits).
+    # Scratch space is per-thread; the compiled database is shared.
+    scratch = getattr(_hs_scratch, "scratch", None)
+    if scratch is None:
+        scratch = _hs_scratch.scratch = hyperscan.Scratch(db)
+    matched: List[int] = []
+    db.scan(
+        text.encode("ascii"),
+        match_event_handler=lambda pattern_id, *_: matched.append(pattern_id),
+        scratch=scratch,
+    )
+    results: Dict[PainCategory, float] = {}
+    for pattern_id in sorted(matched):
+        category, pattern, weight = _FLAT_PATTERNS[pattern_id]
+        if pattern.search(text):
+            results[category] = results.get(category, 0.0) + weight
+    return results
+
+
 # Per-category base score multipliers (used by scorer)
 PAIN_FACTORS: Dict[PainCategory, float] = {
     PainCategory.BURNOUT: 1.5,
@@ -316,14 +389,29 @@ MAINTAINER_PATTERNS: List[re.Pattern[str]] = [
     re.compile(p, re.IGNORECASE | re.DOTALL) for p in _MAINTAINER_RAW
 ]
 
+# Layer 2 only needs "any signal?", which one alternation answers in a single
+# scan that stops at the first hit.
+MAINTAINER_FUSED: re.Pattern[str] = re.compile(
+    "|".join(f"(?:{p})" for p in _MAINTAINER_RAW), re.IGNORECASE | re.DOTALL
+)
+
 
 def count_keyword_hits(text: str) -> Dict[PainCategory, float]:
     """Return weighted hit counts per PainCategory for *text*.
 
-    Returns an empty dict if no patterns match.
+    Returns an empty dict if no patterns match.  Uses Hyperscan for ASCII
+    text when it is installed (``pip install oss-radar[speed]``), otherwise
+    ``re``.
     """
+    if text.isascii():
+        db = _hyperscan_db()
+        if db is not None:
+            return _hyperscan_hits(db, text)
+
     results: Dict[PainCategory, float] = {}
     for category, compiled in COMPILED_PATTERNS.items():
+        if not FUSED_PATTERNS[category].search(text):
+            continue
         total_weight = 0.0
         for pattern, weight in compiled:
             if pattern.search(text):
@@ -43,13 +43,14 @@ class SignalScorer:
             for p in posts
         ]
 
-        max_karma = max(karmas) if karmas else 0.0
-        max_engagement = max(engagements) if engagements else 0.0
+        # Batch-invariant denominators, computed once rather than per post.
+        karma_denom = math.log10(max(karmas) + 1)
+        engagement_denom = math.log10(max(engagements) + 1)
 
         scored: List[ScoredPost] = []
         for post, karma, eng in zip(posts, karmas, engagements):
-            influence_norm = self._log10_norm(karma, max_karma)
-            engagement_norm = self._log10_norm(eng, max_engagement)
+            influence_norm = self._scaled_log10(karma, karma_denom)
+            engagement_norm = self._scaled_log10(eng, engagement_denom)
 
             pain_factor = self._pain_factor(post)
             sentiment_factor = self._sentiment_factor(post)
@@ -91,6 +92,16 @@ class SignalScorer:
         result = math.log10(value + 1) / denom
         return max(0.0, min(1.0, result))
 
+    @staticmethod
+    def _scaled_log10(value: float, denom: float) -> float:
+        """log10(value + 1) / denom, clamped [0, 1]; 0.0 when denom <= 0.
+
+        Same result as :meth:`_log10_norm` with ``denom = log10(max_value + 1)``.
+        """
+        if denom <= 0:
+            return 0.0
+        return max(0.0, min(1.0, math.log10(value + 1) / denom))
+
     @staticmethod
     def _log1p_norm(value: float, max_value: float) -> float:
         """log1p(value) / log1p(max_value), clamped [0, 1]."""
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple
 
 from radar.config import Settings
-from radar.models import RawPost
-from radar.scraping.http import SafeHTTPClient
+from radar.models import RawPost, _sha256_url
+from radar.scraping.http import SafeHTTPClient, get_default_client
+
+try:
+    import orjson  # type: ignore[import]
+
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent requests a single scraper issues (tags/feeds).
+_MAX_FETCH_WORKERS = 4
+
 
 class BaseScraper(ABC):
     """Contract that every platform scraper must implement.
@@ -25,12 +36,7 @@ class BaseScraper(ABC):
 
     def __init__(self, config: Settings, client: SafeHTTPClient | None = None) -> None:
         self.config = config
-        self.client = client or SafeHTTPClient(
-            timeout=config.request_timeout,
-            max_retries=config.max_retries,
-            min_wait=config.retry_min_wait,
-            max_wait=config.retry_max_wait,
-        )
+        self.client = client or get_default_client(config)
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -70,8 +76,37 @@ class BaseScraper(ABC):
 
     def _dedup_key(self, url: str) -> str:
         """Return SHA-256 hex digest of a normalised URL (dedup key)."""
-        normalised = url.strip().lower().rstrip("/")
-        return hashlib.sha256(normalised.encode()).hexdigest()
+        return _sha256_url(url)
+
+    @staticmethod
+    def _load_json(content: bytes) -> Any:
+        """Decode a JSON response body (orjson when installed)."""
+        if _ORJSON_AVAILABLE:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    def _fetch_concurrently(
+        self,
+        fetch: Callable[[str], List[RawPost]],
+        keys: Sequence[str],
+    ) -> List[Tuple[str, List[RawPost] | Exception]]:
+        """Run ``fetch(key)`` for every key on a small thread pool.
+
+        Returns ``(key, batch)`` pairs in *keys* order; a failing fetch yields
+        its exception in place of the batch so callers can log and continue.
+        """
+
+        def _safe(key: str) -> List[RawPost] | Exception:
+            try:
+                return fetch(key)
+            except Exception as exc:
+                return exc
+
+        if not keys:
+            return []
+        workers = min(len(keys), _MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(zip(keys, pool.map(_safe, keys)))
 
     def _build_post(self, raw: dict) -> RawPost:
         """Build a RawPost from a raw dict with sensible defaults."""
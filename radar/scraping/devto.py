@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List
+from urllib.parse import urlencode
 
 from radar.config import Settings
 from radar.models import RawPost
@@ -15,6 +16,11 @@ logger = logging.getLogger(__name__)
 
 _DEVTO_API = "https://dev.to/api/articles"
 _TAGS = ["opensource", "devops", "python", "github"]
+# Fully-encoded request URL per tag, built once at import.
+_DEVTO_URLS: Dict[str, str] = {
+    tag: f"{_DEVTO_API}?{urlencode({'tag': tag, 'per_page': 20, 'top': 1})}"
+    for tag in _TAGS
+}
 
 
 class DevToScraper(BaseScraper):
@@ -29,33 +35,30 @@ class DevToScraper(BaseScraper):
         """Fetch articles for each configured tag."""
         posts: List[RawPost] = []
         seen_ids: set[str] = set()
-        for tag in _TAGS:
-            try:
-                batch = self._fetch_tag(tag)
-                for post in batch:
-                    if post.url_hash not in seen_ids:
-                        seen_ids.add(post.url_hash)
-                        posts.append(post)
-            except Exception as exc:
+        for tag, batch in self._fetch_concurrently(self._fetch_tag, _TAGS):
+            if isinstance(batch, Exception):
                 logger.warning(
                     "devto_tag_fetch_failed",
-                    extra={"tag": tag, "error": str(exc)},
+                    extra={"tag": tag, "error": str(batch)},
                 )
+                continue
+            for post in batch:
+                if post.url_hash not in seen_ids:
+                    seen_ids.add(post.url_hash)
+                    posts.append(post)
         return posts
 
     def _fetch_tag(self, tag: str) -> List[RawPost]:
         """Fetch up to 20 articles for a single tag."""
-        params = {
-            "tag": tag,
-            "per_page": 20,
-            "top": 1,
-        }
-        response = self.client.get(_DEVTO_API, params=params)
-        articles: List[Dict[str, Any]] = response.json()
-        return [self._article_to_post(a) for a in articles]
-
-    def _article_to_post(self, article: Dict[str, Any]) -> RawPost:
-        """Convert a Dev.to article JSON object to a RawPost."""
+        response = self.client.get(_DEVTO_URLS[tag])
+        articles: List[Dict[str, Any]] = self._load_json(response.content)
+        batch_now = datetime.now(timezone.utc)
+        return [self._article_to_post(a, batch_now) for a in articles]
+
+    def _article_to_post(
+        self, article: Dict[str, Any], scraped_at: datetime | None = None
+    ) -> RawPost:
+        """Convert a Dev.to article JSON object to a RawPost stamped with *scraped_at*."""
         url = article.get("url", "") or article.get("canonical_url", "")
         title = article.get("title", "")
         body = article.get("description", "") or article.get("body_markdown", "") or ""
@@ -70,9 +73,7 @@ class DevToScraper(BaseScraper):
         created_utc: datetime | None = None
         if published_str:
             try:
-                created_utc = datetime.fromisoformat(
-                    published_str.replace("Z", "+00:00")
-                )
+                created_utc = datetime.fromisoformat(published_str)
             except ValueError:
                 created_utc = None
 
@@ -96,6 +97,6 @@ class DevToScraper(BaseScraper):
             comments=comments,
             comment_count=comments,
             tags=tag_list,
-            scraped_at=datetime.utcnow(),
+            scraped_at=scraped_at or datetime.now(timezone.utc),
             created_utc=created_utc,
         )
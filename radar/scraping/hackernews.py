@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List
+from urllib.parse import urlencode
 
 from radar.config import Settings
 from radar.models import RawPost
@@ -15,6 +16,11 @@ logger = logging.getLogger(__name__)
 
 _HN_SEARCH_URL = "https://hn.algolia.com/api/v1/search_by_date"
 _TAGS = ["ask_hn", "show_hn"]
+# Fully-encoded request URL per tag, built once at import.
+_HN_URLS: Dict[str, str] = {
+    tag: f"{_HN_SEARCH_URL}?{urlencode({'tags': tag, 'hitsPerPage': 25})}"
+    for tag in _TAGS
+}
 
 
 class HNScraper(BaseScraper):
@@ -28,30 +34,28 @@ class HNScraper(BaseScraper):
     def fetch_raw(self) -> List[RawPost]:
         """Fetch recent posts for each HN tag type."""
         posts: List[RawPost] = []
-        for tag in _TAGS:
-            try:
-                batch = self._fetch_tag(tag)
-                posts.extend(batch)
-            except Exception as exc:
+        for tag, batch in self._fetch_concurrently(self._fetch_tag, _TAGS):
+            if isinstance(batch, Exception):
                 logger.warning(
                     "hn_tag_fetch_failed",
-                    extra={"tag": tag, "error": str(exc)},
+                    extra={"tag": tag, "error": str(batch)},
                 )
+                continue
+            posts.extend(batch)
         return posts
 
     def _fetch_tag(self, tag: str) -> List[RawPost]:
         """Fetch up to 25 posts for a single tag."""
-        params = {
-            "tags": tag,
-            "hitsPerPage": 25,
-        }
-        response = self.client.get(_HN_SEARCH_URL, params=params)
-        data = response.json()
+        response = self.client.get(_HN_URLS[tag])
+        data = self._load_json(response.content)
         hits: List[Dict[str, Any]] = data.get("hits", [])
-        return [self._hit_to_post(hit) for hit in hits]
+        batch_now = datetime.now(timezone.utc)
+        return [self._hit_to_post(hit, batch_now) for hit in hits]
 
-    def _hit_to_post(self, hit: Dict[str, Any]) -> RawPost:
-        """Convert an Algolia hit to a RawPost."""
+    def _hit_to_post(
+        self, hit: Dict[str, Any], scraped_at: datetime | None = None
+    ) -> RawPost:
+        """Convert an Algolia hit to a RawPost stamped with *scraped_at*."""
         object_id = hit.get("objectID", "")
         url = hit.get("url", "") or f"https://news.ycombinator.com/item?id={object_id}"
         title = hit.get("title", "") or hit.get("story_title", "")
@@ -65,9 +69,7 @@ class HNScraper(BaseScraper):
         created_utc: datetime | None = None
         if created_str:
             try:
-                created_utc = datetime.fromisoformat(
-                    created_str.replace("Z", "+00:00")
-                )
+                created_utc = datetime.fromisoformat(created_str)
             except ValueError:
                 created_utc = None
 
@@ -88,6 +90,6 @@ class HNScraper(BaseScraper):
             comments=num_comments,
             comment_count=num_comments,
             tags=tags,
-            scraped_at=datetime.utcnow(),
+            scraped_at=scraped_at or datetime.now(timezone.utc),
             created_utc=created_utc,
         )
@@ -3,14 +3,18 @@
 Security notes:
 - Blocks localhost/link-local/RFC1918/private/reserved IP ranges (IPv4 + IPv6)
 - Fails closed on DNS resolution errors
+- Caches a host's passing DNS check for a short TTL; hostnames are never trusted
 - Re-validates each redirect hop (no follow_redirects fail-open)
 """
 
 from __future__ import annotations
 
+import atexit
 import ipaddress
 import socket
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -21,6 +25,9 @@ from tenacity import (
     wait_exponential,
 )
 
+if TYPE_CHECKING:
+    from radar.config import Settings
+
 # Networks that must never be reachable from scrapers.
 # Includes RFC1918, loopback, link-local, CGNAT, multicast, and reserved blocks.
 _DISALLOWED_NETWORKS = [
@@ -47,6 +54,11 @@ _DISALLOWED_NETWORKS = [
     ipaddress.ip_network("ff00::/8"),   # multicast
 ]
 
+# Seconds a host that resolved only to public IPs stays approved before its
+# next request repeats the getaddrinfo() + private-IP sweep.  Kept short so
+# a changed DNS answer is picked up quickly; failed checks are never cached.
+_DNS_CHECK_TTL = 60.0
+
 
 def _is_disallowed_ip(ip_str: str) -> bool:
     """Return True if *ip_str* is private/loopback/link-local/reserved."""
@@ -95,6 +107,8 @@ class SafeHTTPClient:
         self.min_wait = min_wait
         self.max_wait = max_wait
         self.max_redirects = max_redirects
+        # host -> time.monotonic() deadline until which its DNS check holds
+        self._checked_hosts: Dict[str, float] = {}
         self._client = httpx.Client(
             timeout=httpx.Timeout(timeout),
             follow_redirects=False,  # redirect hops must be re-validated
@@ -144,6 +158,9 @@ class SafeHTTPClient:
         if host == "localhost" or host.endswith(".localhost"):
             raise SSRFError(f"SSRF protection: hostname not allowed: {host!r}")
 
+        if self._checked_hosts.get(host, 0.0) > time.monotonic():
+            return
+
         # Resolve host to IPs and check each one. Fail closed if DNS fails.
         try:
             addr_infos = socket.getaddrinfo(host, None)
@@ -157,6 +174,8 @@ class SafeHTTPClient:
                     f"SSRF protection: {host!r} resolves to disallowed IP {ip_str!r}"
                 )
 
+        self._checked_hosts[host] = time.monotonic() + _DNS_CHECK_TTL
+
     def _request_follow_redirects(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         """Perform request, manually following redirects with per-hop re-validation."""
         current = url
@@ -192,3 +211,48 @@ class SafeHTTPClient:
         response = self._request_follow_redirects(method, url, **kwargs)
         response.raise_for_status()
         return response
+
+
+# Process-wide clients shared by every scraper so keep-alive connections are
+# pooled across platforms instead of one httpx pool per scraper instance.
+# Keyed by the settings a client is built from, so a Settings object with a
+# different timeout or retry policy gets its own client, not the first one.
+_default_clients: Dict[Tuple[int, int, float, float], SafeHTTPClient] = {}
+_default_client_lock = threading.Lock()
+
+
+def get_default_client(config: "Settings | None" = None) -> SafeHTTPClient:
+    """Return the shared SafeHTTPClient for *config*'s HTTP settings.
+
+    Defaults to :func:`radar.config.get_settings`.  Clients are closed
+    automatically at interpreter exit.
+    """
+    if config is None:
+        from radar.config import get_settings
+
+        config = get_settings()
+    key = (
+        config.request_timeout,
+        config.max_retries,
+        config.retry_min_wait,
+        config.retry_max_wait,
+    )
+    with _default_client_lock:
+        client = _default_clients.get(key)
+        if client is None:
+            client = _default_clients[key] = SafeHTTPClient(
+                timeout=config.request_timeout,
+                max_retries=config.max_retries,
+                min_wait=config.retry_min_wait,
+                max_wait=config.retry_max_wait,
+            )
+        return client
+
+
+@atexit.register
+def _close_default_clients() -> None:
+    """Close and forget every shared client."""
+    with _default_client_lock:
+        for client in _default_clients.values():
+            client.close()
+        _default_clients.clear()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 from radar.config import Settings
@@ -34,29 +34,31 @@ class LobstersScraper(BaseScraper):
         posts: List[RawPost] = []
         seen_ids: set[str] = set()
 
-        for endpoint in _LOBSTERS_ENDPOINTS:
-            try:
-                batch = self._fetch_feed(endpoint)
-                for post in batch:
-                    if post.url_hash not in seen_ids:
-                        seen_ids.add(post.url_hash)
-                        posts.append(post)
-            except Exception as exc:
+        for endpoint, batch in self._fetch_concurrently(self._fetch_feed, _LOBSTERS_ENDPOINTS):
+            if isinstance(batch, Exception):
                 logger.warning(
                     "lobsters_feed_failed",
-                    extra={"url": endpoint, "error": str(exc)},
+                    extra={"url": endpoint, "error": str(batch)},
                 )
+                continue
+            for post in batch:
+                if post.url_hash not in seen_ids:
+                    seen_ids.add(post.url_hash)
+                    posts.append(post)
 
         return posts
 
     def _fetch_feed(self, url: str) -> List[RawPost]:
         """Fetch and parse a single Lobsters JSON feed."""
         response = self.client.get(url)
-        stories: List[Dict[str, Any]] = response.json()
-        return [self._story_to_post(s) for s in stories]
-
-    def _story_to_post(self, story: Dict[str, Any]) -> RawPost:
-        """Convert a Lobsters story dict to a RawPost."""
+        stories: List[Dict[str, Any]] = self._load_json(response.content)
+        batch_now = datetime.now(timezone.utc)
+        return [self._story_to_post(s, batch_now) for s in stories]
+
+    def _story_to_post(
+        self, story: Dict[str, Any], scraped_at: datetime | None = None
+    ) -> RawPost:
+        """Convert a Lobsters story dict to a RawPost stamped with *scraped_at*."""
         story_url = story.get("url", "") or story.get("short_id_url", "")
         # For text posts, use the comments URL
         if not story_url:
@@ -78,9 +80,7 @@ class LobstersScraper(BaseScraper):
         created_utc: datetime | None = None
         if created_str:
             try:
-                created_utc = datetime.fromisoformat(
-                    created_str.replace("Z", "+00:00")
-                )
+                created_utc = datetime.fromisoformat(created_str)
             except ValueError:
                 created_utc = None
 
@@ -101,6 +101,6 @@ class LobstersScraper(BaseScraper):
             comments=comments,
             comment_count=comments,
             tags=tags,
-            scraped_at=datetime.utcnow(),
+            scraped_at=scraped_at or datetime.now(timezone.utc),
             created_utc=created_utc,
         )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from radar.config import Settings
 from radar.models import RawPost
@@ -52,29 +52,70 @@ class RedditScraper(BaseScraper):
             user_agent=self.config.reddit_user_agent,
         )
 
-        posts: List[RawPost] = []
+        # Collect every listing first so author karma can be resolved in one
+        # batched lookup instead of a lazy per-submission Redditor fetch.
+        batches: List[Tuple[str, datetime, List[Any]]] = []
         for sub_name in self._subreddits:
             try:
                 subreddit = reddit.subreddit(sub_name)
-                for submission in subreddit.new(limit=25):
-                    try:
-                        post = self._submission_to_post(submission)
-                        posts.append(post)
-                    except Exception as exc:
-                        logger.debug(
-                            "reddit_post_parse_error",
-                            extra={"sub": sub_name, "error": str(exc)},
-                        )
+                batch_now = datetime.now(timezone.utc)
+                batches.append((sub_name, batch_now, list(subreddit.new(limit=25))))
             except Exception as exc:
                 logger.warning(
                     "reddit_subreddit_failed",
                     extra={"sub": sub_name, "error": str(exc)},
                 )
 
+        karma_by_author = self._fetch_author_karma(
+            reddit, [s for _, _, submissions in batches for s in submissions]
+        )
+
+        posts: List[RawPost] = []
+        for sub_name, batch_now, submissions in batches:
+            for submission in submissions:
+                try:
+                    post = self._submission_to_post(submission, batch_now, karma_by_author)
+                    posts.append(post)
+                except Exception as exc:
+                    logger.debug(
+                        "reddit_post_parse_error",
+                        extra={"sub": sub_name, "error": str(exc)},
+                    )
+
         return posts
 
-    def _submission_to_post(self, submission: object) -> RawPost:
-        """Convert a PRAW submission to a RawPost."""
+    def _fetch_author_karma(self, reddit: Any, submissions: List[Any]) -> Dict[str, int]:
+        """Return ``{author_fullname: link_karma}`` via batched partial-redditor lookups.
+
+        PRAW resolves up to 100 accounts per request.  Failures are logged and
+        yield an empty mapping (karma then defaults to 0).
+        """
+        fullnames = {
+            fullname
+            for submission in submissions
+            if (fullname := vars(submission).get("author_fullname"))
+        }
+        karma: Dict[str, int] = {}
+        if not fullnames:
+            return karma
+        try:
+            for partial in reddit.redditors.partial_redditors(sorted(fullnames)):
+                karma[partial.fullname] = int(getattr(partial, "link_karma", 0) or 0)
+        except Exception as exc:
+            logger.warning("reddit_karma_lookup_failed", extra={"error": str(exc)})
+        return karma
+
+    def _submission_to_post(
+        self,
+        submission: object,
+        scraped_at: datetime | None = None,
+        karma_by_author: Dict[str, int] | None = None,
+    ) -> RawPost:
+        """Convert a PRAW submission to a RawPost stamped with *scraped_at*.
+
+        Author karma comes from *karma_by_author*; the submission's lazy
+        ``author`` Redditor is never fetched.
+        """
         url = getattr(submission, "url", "")
         permalink = getattr(submission, "permalink", "")
         if permalink:
@@ -83,12 +124,8 @@ class RedditScraper(BaseScraper):
         body = getattr(submission, "selftext", "") or ""
         author_obj = getattr(submission, "author", None)
         author_name = str(getattr(author_obj, "name", "")) if author_obj else ""
-        author_karma = 0
-        if author_obj:
-            try:
-                author_karma = int(getattr(author_obj, "link_karma", 0))
-            except Exception:
-                author_karma = 0
+        author_fullname = vars(submission).get("author_fullname", "")
+        author_karma = (karma_by_author or {}).get(author_fullname, 0)
 
         created_ts = getattr(submission, "created_utc", 0)
         created_at = datetime.fromtimestamp(float(created_ts), tz=timezone.utc)
@@ -110,6 +147,6 @@ class RedditScraper(BaseScraper):
             comments=int(getattr(submission, "num_comments", 0)),
             comment_count=int(getattr(submission, "num_comments", 0)),
             tags=tags,
-            scraped_at=datetime.utcnow(),
+            scraped_at=scraped_at or datetime.now(timezone.utc),
             created_utc=created_at,
         )
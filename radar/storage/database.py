@@ -5,15 +5,84 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from radar.models import PainCategory, ScoredPost
 
+try:
+    import orjson  # type: ignore[import]
+
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _ORJSON_AVAILABLE = False
+
+# Prepared-statement LRU size per connection (stdlib default is 128).
+_STATEMENT_CACHE_SIZE = 256
+
+_POST_VALUES_SQL = """
+    INTO posts (
+        url, url_hash, title, body, platform, author,
+        followers, upvotes, comments, tags,
+        pain_categories, pain_score, sentiment, final_score, signal_score,
+        influence_norm, engagement_norm, pain_factor, sentiment_factor,
+        maintainer_boost, is_maintainer, source_tier, backfill_source,
+        scraped_at, created_at
+    ) VALUES (
+        ?,?,?,?,?,?,
+        ?,?,?,?,
+        ?,?,?,?,?,
+        ?,?,?,?,
+        ?,?,?,?,
+        ?,?
+    )
+"""
+_INSERT_POST_SQL = f"INSERT {_POST_VALUES_SQL} ON CONFLICT(url_hash) DO NOTHING RETURNING id"
+# RETURNING needs SQLite 3.35+; older libraries insert with this and read
+# the new rowid from the cursor instead.
+_INSERT_OR_IGNORE_POST_SQL = f"INSERT OR IGNORE {_POST_VALUES_SQL}"
+_RETURNING_MIN_VERSION = (3, 35, 0)
+
+
+# Stored category value -> enum member; unknown values are dropped on read.
+_PAIN_BY_VALUE = {c.value: c for c in PainCategory}
+
+# Column list shared by every ScoredPost read; _row_to_scored indexes by position.
+_POST_COLS = """
+    url, url_hash, title, body, platform, author,
+    followers, upvotes, comments, tags,
+    pain_categories, pain_score, sentiment, final_score, signal_score,
+    influence_norm, engagement_norm, pain_factor, sentiment_factor,
+    maintainer_boost, is_maintainer, source_tier, backfill_source,
+    scraped_at
+"""
+
+
+def _json_dumps(value: list) -> str:
+    """Encode a JSON list column (orjson when installed)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_list(raw: Optional[str]) -> list:
+    """Decode a JSON list column; the common empty default skips the parser.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib type either way.
+    """
+    if not raw or raw == "[]":
+        return []
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def _now_iso() -> str:
-    return datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
+    """Return the current UTC time as an ISO-8601 string (one datetime alloc)."""
+    return datetime.now(timezone.utc).isoformat()
 
 
 class Database:
@@ -25,8 +94,12 @@ class Database:
     def __init__(self, path: str = "~/.radar/catalog.db") -> None:
         self.path = str(Path(path).expanduser().resolve())
         Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Under WAL a reader only runs alongside a writer on its own
+        # connection: mutations use _conn, SELECT-only queries use _read_conn.
+        self._has_returning = sqlite3.sqlite_version_info >= _RETURNING_MIN_VERSION
         self._conn = self._open()
         self._migrate()
+        self._read_conn = self._open()
 
     # ------------------------------------------------------------------
     # Connection helpers
@@ -35,19 +108,55 @@ class Database:
     def _open(self) -> sqlite3.Connection:
         """Open connection; create file with 0600 perms if new."""
         is_new = not Path(self.path).exists()
-        conn = sqlite3.connect(self.path, check_same_thread=False)
+        # sqlite3 keeps an LRU of prepared statements keyed by SQL text; every
+        # query here is a module/method constant, so each is prepared once.
+        # isolation_level=None: single statements autocommit; multi-statement
+        # writes opt into one transaction via _transaction().
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            isolation_level=None,
+        )
         if is_new:
             os.chmod(self.path, 0o600)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB memory-mapped reads
+        conn.execute("PRAGMA wal_autocheckpoint = 1000")
+        conn.execute("PRAGMA busy_timeout = 3000")
         return conn
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one BEGIN IMMEDIATE … COMMIT block.
+
+        IMMEDIATE takes the write lock up front, so a concurrent writer waits on
+        busy_timeout at BEGIN rather than failing mid-batch on lock upgrade.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
     def close(self) -> None:
-        """Close the underlying connection."""
-        if self._conn:
-            self._conn.close()
+        """Close the read and write connections."""
+        try:
+            # Refresh stale planner stats (0x10000: check every table, since
+            # the reads that would benefit ran on _read_conn).  optimize
+            # writes sqlite_stat1, so it runs on the write connection only.
+            self._conn.execute("PRAGMA optimize = 0x10002")
+        except sqlite3.ProgrammingError:
+            pass  # already closed
+        self._read_conn.close()
+        self._conn.close()
 
     def __enter__(self) -> "Database":
         return self
@@ -121,9 +230,15 @@ class Database:
                 ON posts(reported_at);
             CREATE INDEX IF NOT EXISTS idx_reports_type_date
                 ON reports(report_type, report_date);
+            CREATE INDEX IF NOT EXISTS idx_report_entries_post
+                ON report_entries(post_id);
+            -- Partial index: only the (small) unreported backlog, pre-sorted
+            -- for fetch_archive / fetch_all_unreported.
+            CREATE INDEX IF NOT EXISTS idx_posts_unreported
+                ON posts(signal_score DESC, scraped_at)
+                WHERE reported_at IS NULL;
             """
         )
-        self._conn.commit()
 
     # ------------------------------------------------------------------
     # Post CRUD
@@ -134,51 +249,33 @@ class Database:
 
         Returns the rowid of the existing or newly-inserted row.
         """
-        existing = self._conn.execute(
-            "SELECT id FROM posts WHERE url_hash = ?", (post.url_hash,)
-        ).fetchone()
-        if existing:
-            return int(existing["id"])
+        return self.upsert_posts([post])[0]
 
-        now = _now_iso()
-        scraped = post.scraped_at.isoformat() if post.scraped_at else now
-        cats_json = json.dumps([c.value for c in post.pain_categories])
-        tags_json = json.dumps(post.tags)
+    def upsert_posts(self, posts: List[ScoredPost]) -> List[Optional[int]]:
+        """Insert a batch of posts in a single transaction; skip known url_hashes.
 
-        cur = self._conn.execute(
-            """
-            INSERT INTO posts (
-                url, url_hash, title, body, platform, author,
-                followers, upvotes, comments, tags,
-                pain_categories, pain_score, sentiment, final_score, signal_score,
-                influence_norm, engagement_norm, pain_factor, sentiment_factor,
-                maintainer_boost, is_maintainer, source_tier, backfill_source,
-                scraped_at, created_at
-            ) VALUES (
-                ?,?,?,?,?,?,
-                ?,?,?,?,
-                ?,?,?,?,?,
-                ?,?,?,?,
-                ?,?,?,?,
-                ?,?
-            )
-            """,
-            (
-                post.url, post.url_hash, post.title, post.body,
-                post.platform, post.author,
-                post.effective_followers(), post.effective_upvotes(),
-                post.effective_comments(), tags_json,
-                cats_json, post.pain_score, post.sentiment,
-                post.final_score, post.signal_score,
-                post.influence_norm, post.engagement_norm,
-                post.pain_factor, post.sentiment_factor,
-                post.maintainer_boost, int(post.is_maintainer),
-                post.source_tier, post.backfill_source,
-                scraped, now,
-            ),
-        )
-        self._conn.commit()
-        return cur.lastrowid
+        Returns the rowid of the existing or newly-inserted row for each post,
+        in input order.
+        """
+        now = _now_iso()
+        ids: List[Optional[int]] = []
+        with self._transaction():
+            # One cursor for the whole batch instead of one per statement.
+            cur = self._conn.cursor()
+            for post in posts:
+                params = self._post_params(post, now)
+                if self._has_returning:
+                    row = cur.execute(_INSERT_POST_SQL, params).fetchone()
+                else:
+                    cur.execute(_INSERT_OR_IGNORE_POST_SQL, params)
+                    row = (cur.lastrowid,) if cur.rowcount == 1 else None
+                if row is None:
+                    # The insert was skipped for an existing url_hash
+                    row = cur.execute(
+                        "SELECT id FROM posts WHERE url_hash = ?", (post.url_hash,)
+                    ).fetchone()
+                ids.append(int(row[0]) if row else None)
+        return ids
 
     def mark_reported(self, post_id: int) -> None:
         """Set reported_at = now for the given post row."""
@@ -186,17 +283,14 @@ class Database:
             "UPDATE posts SET reported_at = ? WHERE id = ?",
             (_now_iso(), post_id),
         )
-        self._conn.commit()
 
     def fetch_archive(self, days: int, limit: int = 50) -> List[ScoredPost]:
         """Return unreported posts from the last *days* days, ordered by signal_score."""
-        cutoff = (
-            datetime.utcnow() - timedelta(days=days)
-        ).replace(tzinfo=timezone.utc).isoformat()
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
-        rows = self._conn.execute(
-            """
-            SELECT * FROM posts
+        rows = self._read_conn.execute(
+            f"""
+            SELECT {_POST_COLS} FROM posts
             WHERE scraped_at >= ?
               AND reported_at IS NULL
             ORDER BY signal_score DESC
@@ -207,11 +301,37 @@ class Database:
 
         return [self._row_to_scored(row) for row in rows]
 
+    def fetch_archive_tiered(
+        self, recent_days: int, days: int, limit: int
+    ) -> List[Tuple[bool, ScoredPost]]:
+        """Return unreported posts from the last *days* days in one query.
+
+        Each item is ``(is_recent, post)``.  Posts from the last
+        *recent_days* days come first, then the older remainder; each group
+        is ordered by signal_score.
+        """
+        now = datetime.now(timezone.utc)
+        recent_cutoff = (now - timedelta(days=recent_days)).isoformat()
+        cutoff = (now - timedelta(days=days)).isoformat()
+
+        rows = self._read_conn.execute(
+            f"""
+            SELECT scraped_at >= ? AS is_recent, {_POST_COLS} FROM posts
+            WHERE scraped_at >= ?
+              AND reported_at IS NULL
+            ORDER BY is_recent DESC, signal_score DESC
+            LIMIT ?
+            """,
+            (recent_cutoff, cutoff, limit),
+        ).fetchall()
+
+        return [(bool(row[0]), self._row_to_scored(row[1:])) for row in rows]
+
     def fetch_all_unreported(self, limit: int = 50) -> List[ScoredPost]:
         """Return all unreported posts ordered by signal_score."""
-        rows = self._conn.execute(
-            """
-            SELECT * FROM posts
+        rows = self._read_conn.execute(
+            f"""
+            SELECT {_POST_COLS} FROM posts
             WHERE reported_at IS NULL
             ORDER BY signal_score DESC
             LIMIT ?
@@ -220,6 +340,37 @@ class Database:
         ).fetchall()
         return [self._row_to_scored(row) for row in rows]
 
+    def fetch_top_unreported_minimal(
+        self, limit: int = 50
+    ) -> List[Tuple[int, str, float]]:
+        """Return ``(id, url_hash, signal_score)`` for the top unreported posts.
+
+        Lets callers pick survivors before paying for full ScoredPost hydration
+        via :meth:`fetch_posts_by_ids`.
+        """
+        rows = self._read_conn.execute(
+            """
+            SELECT id, url_hash, signal_score FROM posts
+            WHERE reported_at IS NULL
+            ORDER BY signal_score DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def fetch_posts_by_ids(self, post_ids: List[int]) -> List[ScoredPost]:
+        """Hydrate the given post ids, returned in the order requested."""
+        if not post_ids:
+            return []
+        placeholders = ",".join("?" * len(post_ids))
+        rows = self._read_conn.execute(
+            f"SELECT id, {_POST_COLS} FROM posts WHERE id IN ({placeholders})",
+            post_ids,
+        ).fetchall()
+        by_id = {row[0]: self._row_to_scored(row[1:]) for row in rows}
+        return [by_id[post_id] for post_id in post_ids if post_id in by_id]
+
     # ------------------------------------------------------------------
     # Report CRUD
     # ------------------------------------------------------------------
@@ -235,7 +386,6 @@ class Database:
                 """,
                 (report_type, report_date, now),
             )
-            self._conn.commit()
             return cur.lastrowid  # type: ignore[return-value]
         except sqlite3.IntegrityError:
             # Already exists
@@ -260,31 +410,37 @@ class Database:
             """,
             (entry_count, status, sent_at or _now_iso(), report_id),
         )
-        self._conn.commit()
 
     def add_report_entry(
         self, report_id: int, post_id: int, rank: int, provenance: str = "live"
     ) -> None:
         """Link a post to a report."""
-        try:
-            self._conn.execute(
+        self.add_report_entries(report_id, [(post_id, rank, provenance)])
+
+    def add_report_entries(
+        self, report_id: int, entries: List[Tuple[int, int, str]]
+    ) -> None:
+        """Link a batch of ``(post_id, rank, provenance)`` to a report in one transaction.
+
+        Entries that are already linked are ignored.
+        """
+        with self._transaction():
+            self._conn.executemany(
                 """
-                INSERT INTO report_entries (report_id, post_id, rank, provenance)
+                INSERT OR IGNORE INTO report_entries (report_id, post_id, rank, provenance)
                 VALUES (?, ?, ?, ?)
                 """,
-                (report_id, post_id, rank, provenance),
+                [
+                    (report_id, post_id, rank, provenance)
+                    for post_id, rank, provenance in entries
+                ],
             )
-            self._conn.commit()
-        except sqlite3.IntegrityError:
-            pass  # already linked
 
     def check_duplicate_run(self, hours: int = 20) -> bool:
         """Return True if a successful daily report exists within the last *hours*."""
-        cutoff = (
-            datetime.utcnow() - timedelta(hours=hours)
-        ).replace(tzinfo=timezone.utc).isoformat()
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
 
-        row = self._conn.execute(
+        row = self._read_conn.execute(
             """
             SELECT id FROM reports
              WHERE report_type = 'daily'
@@ -303,14 +459,15 @@ class Database:
         start_iso = week_start.isoformat()
         end_iso = week_end.isoformat()
 
-        rows = self._conn.execute(
-            """
-            SELECT DISTINCT p.*
+        rows = self._read_conn.execute(
+            f"""
+            SELECT {_POST_COLS}
               FROM posts p
-              JOIN report_entries re ON re.post_id = p.id
-              JOIN reports r ON r.id = re.report_id
              WHERE p.reported_at >= ?
                AND p.reported_at <= ?
+               AND EXISTS (
+                   SELECT 1 FROM report_entries re WHERE re.post_id = p.id
+               )
              ORDER BY p.signal_score DESC
              LIMIT 10
             """,
@@ -324,14 +481,14 @@ class Database:
 
     def get_stats(self) -> dict:
         """Return a dict with catalog statistics."""
-        post_count = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
-        daily_count = self._conn.execute(
+        post_count = self._read_conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        daily_count = self._read_conn.execute(
             "SELECT COUNT(*) FROM reports WHERE report_type='daily' AND status='sent'"
         ).fetchone()[0]
-        weekly_count = self._conn.execute(
+        weekly_count = self._read_conn.execute(
             "SELECT COUNT(*) FROM reports WHERE report_type='weekly' AND status='sent'"
         ).fetchone()[0]
-        last_run_row = self._conn.execute(
+        last_run_row = self._read_conn.execute(
             "SELECT MAX(created_at) FROM reports"
         ).fetchone()
         last_run = last_run_row[0] if last_run_row else None
@@ -347,60 +504,92 @@ class Database:
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _post_params(post: ScoredPost, now: str) -> tuple:
+        """Return the positional parameters for the post INSERT statements."""
+        scraped = post.scraped_at.isoformat() if post.scraped_at else now
+        return (
+            post.url, post.url_hash, post.title, post.body,
+            post.platform, post.author,
+            post.effective_followers(), post.effective_upvotes(),
+            post.effective_comments(), _json_dumps(post.tags),
+            _json_dumps([c.value for c in post.pain_categories]),
+            post.pain_score, post.sentiment,
+            post.final_score, post.signal_score,
+            post.influence_norm, post.engagement_norm,
+            post.pain_factor, post.sentiment_factor,
+            post.maintainer_boost, int(post.is_maintainer),
+            post.source_tier, post.backfill_source,
+            scraped, now,
+        )
+
     @staticmethod
     def _row_to_scored(row: sqlite3.Row) -> ScoredPost:
-        """Convert a DB row to a ScoredPost."""
-        d = dict(row)
+        """Convert a ``SELECT _POST_COLS`` row to a ScoredPost."""
+        (
+            url, url_hash, title, body, platform, author,
+            followers, upvotes, comments, tags_raw,
+            cats_json, pain_score, sentiment, final_score, signal_score,
+            influence_norm, engagement_norm, pain_factor, sentiment_factor,
+            maintainer_boost, is_maintainer, source_tier, backfill_source,
+            scraped_str,
+        ) = row
 
         # Deserialise JSON fields
         try:
-            cats_raw = json.loads(d.get("pain_categories") or "[]")
-            cats = [PainCategory(c) for c in cats_raw if c]
-        except (json.JSONDecodeError, ValueError):
+            cats = [
+                pc for c in _json_list(cats_json) if (pc := _PAIN_BY_VALUE.get(c))
+            ]
+        except (json.JSONDecodeError, TypeError):
             cats = []
 
         try:
-            tags = json.loads(d.get("tags") or "[]")
+            tags = _json_list(tags_raw)
         except json.JSONDecodeError:
             tags = []
 
-        scraped_str = d.get("scraped_at", "")
         try:
             scraped_at = datetime.fromisoformat(scraped_str)
         except (ValueError, TypeError):
-            scraped_at = datetime.utcnow()
+            scraped_at = datetime.now(timezone.utc)
 
-        final = float(d.get("final_score") or d.get("signal_score") or 0.0)
+        final = float(final_score or signal_score or 0.0)
+        followers = int(followers or 0)
+        upvotes = int(upvotes or 0)
+        comments = int(comments or 0)
+        sentiment = float(sentiment or 0.0)
+        is_maintainer = bool(is_maintainer)
+        source_tier = source_tier or "live"
 
         return ScoredPost(
-            url=d.get("url", ""),
-            url_hash=d.get("url_hash", ""),
-            title=d.get("title", ""),
-            body=d.get("body", "") or "",
-            platform=d.get("platform", ""),
-            author=d.get("author", "") or "",
-            followers=int(d.get("followers") or 0),
-            author_karma=int(d.get("followers") or 0),
-            upvotes=int(d.get("upvotes") or 0),
-            score=int(d.get("upvotes") or 0),
-            comments=int(d.get("comments") or 0),
-            comment_count=int(d.get("comments") or 0),
+            url=url or "",
+            url_hash=url_hash or "",
+            title=title or "",
+            body=body or "",
+            platform=platform or "",
+            author=author or "",
+            followers=followers,
+            author_karma=followers,
+            upvotes=upvotes,
+            score=upvotes,
+            comments=comments,
+            comment_count=comments,
             tags=tags,
             pain_categories=cats,
-            pain_score=float(d.get("pain_score") or 0.0),
-            sentiment=float(d.get("sentiment") or 0.0),
-            raw_sentiment=float(d.get("sentiment") or 0.0),
-            is_maintainer=bool(d.get("is_maintainer")),
-            is_maintainer_context=bool(d.get("is_maintainer")),
-            source_tier=d.get("source_tier") or "live",
-            backfill_source=d.get("backfill_source") or "live",
+            pain_score=float(pain_score or 0.0),
+            sentiment=sentiment,
+            raw_sentiment=sentiment,
+            is_maintainer=is_maintainer,
+            is_maintainer_context=is_maintainer,
+            source_tier=source_tier,
+            backfill_source=backfill_source or "live",
             scraped_at=scraped_at,
-            influence_norm=float(d.get("influence_norm") or 0.0),
-            engagement_norm=float(d.get("engagement_norm") or 0.0),
-            pain_factor=float(d.get("pain_factor") or 1.0),
-            sentiment_factor=float(d.get("sentiment_factor") or 1.0),
-            maintainer_boost=float(d.get("maintainer_boost") or 1.0),
+            influence_norm=float(influence_norm or 0.0),
+            engagement_norm=float(engagement_norm or 0.0),
+            pain_factor=float(pain_factor or 1.0),
+            sentiment_factor=float(sentiment_factor or 1.0),
+            maintainer_boost=float(maintainer_boost or 1.0),
             final_score=final,
             signal_score=final,
-            provenance=d.get("source_tier") or "live",
+            provenance=source_tier,
         )
@@ -1,15 +1,19 @@
 """Pain-point summarizer — LLM-powered one-sentence summaries.
 
-Uses LLMBackend to generate concise summaries of each scored post.
-Graceful degradation: if LLM fails, falls back to 120-char body excerpt.
+Uses LLMBackend to generate concise summaries of each scored post, several
+posts per request.  Graceful degradation: if a batched reply can't be used
+the posts are retried one by one, and if the LLM fails for a post it falls
+back to a 120-char body excerpt.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from typing import TYPE_CHECKING, List
 
-from radar.llm import LLMBackend
+from radar.llm import LLMBackend, run_sync
 
 if TYPE_CHECKING:
     from radar.models import ScoredPost
@@ -22,15 +26,126 @@ SYSTEM_PROMPT = (
     "Max 120 characters."
 )
 
+BATCH_SYSTEM_PROMPT = (
+    "Summarize each open source maintainer's pain point below in one sentence. "
+    "Be specific about the technical problem. No generic platitudes. "
+    "Max 120 characters per summary. Respond with only a JSON array of "
+    "strings: one summary per post, in the order given."
+)
+
+# Posts summarized per LLM request; the system prompt is paid once per batch.
+_BATCH_SIZE = 5
+
+# Concurrent LLM requests per summarize_posts() call.
+_MAX_LLM_WORKERS = 8
+
 
 def _excerpt(body: str | None, max_len: int = 120) -> str:
     """Extract a plain-text excerpt from body text."""
     if not body:
         return ""
-    text = body.strip().replace("\n", " ")
+    text = body.strip()  # returns *body* itself when there is nothing to strip
     if len(text) <= max_len:
-        return text
-    return text[: max_len - 3].rsplit(" ", 1)[0] + "..."
+        return text.replace("\n", " ")
+    # Newline -> space is length-preserving, so only the kept head is rewritten.
+    head = text[: max_len - 3].replace("\n", " ")
+    return head.rsplit(" ", 1)[0] + "..."
+
+
+async def _summarize_one(
+    backend: LLMBackend,
+    post: ScoredPost,
+    model: str | None,
+    limit: asyncio.Semaphore,
+) -> bool:
+    """Summarize a single post in place; return True if the LLM succeeded."""
+    user_text = f"Title: {post.title}\n\nBody: {(post.body or '')[:1000]}"
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_text},
+    ]
+    try:
+        async with limit:
+            resp = await backend.complete(messages, model=model, max_tokens=100)
+        post.llm_summary = resp.content.strip()
+        return True
+    except Exception as exc:
+        logger.warning(
+            "LLM summary failed for post %s, using excerpt: %s",
+            getattr(post, "url", "?"),
+            exc,
+        )
+        post.llm_summary = _excerpt(post.body)
+        return False
+
+
+def _parse_batch_reply(content: str, expected: int) -> List[str] | None:
+    """Return the summaries from a batched reply, or None if unusable."""
+    text = content.strip()
+    if text.startswith("```"):
+        # Tolerate a fenced ```json block around the array
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        summaries = json.loads(text)
+    except ValueError:
+        return None
+    if (
+        not isinstance(summaries, list)
+        or len(summaries) != expected
+        or not all(isinstance(s, str) and s.strip() for s in summaries)
+    ):
+        return None
+    return [s.strip() for s in summaries]
+
+
+async def _summarize_batch(
+    backend: LLMBackend,
+    batch: List[ScoredPost],
+    model: str | None,
+    limit: asyncio.Semaphore,
+) -> List[bool]:
+    """Summarize *batch* in one request; retry per post if that fails."""
+    if len(batch) > 1:
+        user_text = json.dumps(
+            [{"title": p.title, "body": (p.body or "")[:1000]} for p in batch]
+        )
+        messages = [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": user_text},
+        ]
+        summaries = None
+        try:
+            async with limit:
+                resp = await backend.complete(
+                    messages, model=model, max_tokens=100 * len(batch)
+                )
+            summaries = _parse_batch_reply(resp.content, len(batch))
+        except Exception as exc:
+            logger.warning("Batched LLM summary failed, retrying per post: %s", exc)
+        if summaries is not None:
+            for post, summary in zip(batch, summaries):
+                post.llm_summary = summary
+            return [True] * len(batch)
+
+    return list(
+        await asyncio.gather(
+            *(_summarize_one(backend, post, model, limit) for post in batch)
+        )
+    )
+
+
+async def _summarize_all(
+    backend: LLMBackend, posts: List[ScoredPost], model: str | None
+) -> List[bool]:
+    limit = asyncio.Semaphore(_MAX_LLM_WORKERS)
+    batches = [posts[i:i + _BATCH_SIZE] for i in range(0, len(posts), _BATCH_SIZE)]
+    try:
+        results = await asyncio.gather(
+            *(_summarize_batch(backend, batch, model, limit) for batch in batches)
+        )
+    finally:
+        await backend.aclose()
+    return [ok for batch_results in results for ok in batch_results]
 
 
 def summarize_posts(
@@ -41,28 +156,15 @@ def summarize_posts(
 ) -> List[ScoredPost]:
     """Add LLM-generated summaries to each scored post.
 
+    Posts are sent ``_BATCH_SIZE`` to a request, and requests are IO-bound,
+    so up to ``_MAX_LLM_WORKERS`` run concurrently on one event loop.
     On LLM failure for any individual post, falls back to a body excerpt.
     """
     backend = LLMBackend(dry_run=dry_run)
-    successes = 0
+    if not posts:
+        return posts
 
-    for post in posts:
-        user_text = f"Title: {post.title}\n\nBody: {(post.body or '')[:1000]}"
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_text},
-        ]
-        try:
-            resp = backend.complete_sync(messages, model=model, max_tokens=100)
-            post.llm_summary = resp.content.strip()
-            successes += 1
-        except Exception as exc:
-            logger.warning(
-                "LLM summary failed for post %s, using excerpt: %s",
-                getattr(post, "url", "?"),
-                exc,
-            )
-            post.llm_summary = _excerpt(post.body)
+    successes = sum(run_sync(_summarize_all(backend, posts, model)))
 
     logger.info(
         "Summarized %d/%d posts via LLM",
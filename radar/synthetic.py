@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import random
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from radar.models import PainCategory, RawPost
@@ -129,20 +130,48 @@ _AUTHORS = [
 ]
 
 
+# (templates, negative, force_positive) per generation bucket, with weights:
+_BUCKETS: list[tuple[list[tuple[str, str, list[PainCategory]]], bool, bool]] = [
+    (_TEMPLATES, True, False),  # full pass: pain + maintainer + negative sentiment
+    (_NON_MAINTAINER_TEMPLATES, True, False),  # fail: no maintainer context
+    (_NO_PAIN_TEMPLATES, False, False),  # fail: no pain keywords
+    (_TEMPLATES, False, True),  # fail: positive sentiment (sentiment gate)
+]
+_BUCKET_WEIGHTS = [0.60, 0.15, 0.15, 0.10]
+
+
+# Regex metacharacter runs to strip (or rewrite) in one pass, longest first.
+_REGEX_META_RE = re.compile(r"\\b|\\s\+|\\d\{4\}|\\d|\[/ _-\]|\[ -\]|\.\*|[?()]")
+_REGEX_META_REPL = {
+    r"\s+": " ",
+    "[/ _-]": " ",
+    "[ -]": " ",
+    ".*": " ",
+    r"\d{4}": "2026",
+    r"\d": "1",
+}
+
+
+def _readable(raw_pattern: str) -> str:
+    """Strip regex anchors/metacharacters from a pattern to get readable text."""
+    return _REGEX_META_RE.sub(
+        lambda m: _REGEX_META_REPL.get(m.group(0), ""), raw_pattern
+    ).strip()
+
+
+# Readable phrases per category, in _RAW_PATTERNS order (same rng.choice index).
+_READABLE_KEYWORDS: dict[PainCategory, list[str]] = {
+    category: [_readable(raw) for raw, _ in patterns]
+    for category, patterns in _RAW_PATTERNS.items()
+}
+
+
 def _pick_keyword(category: PainCategory, rng: random.Random) -> str:
     """Pick a representative keyword phrase from the real pattern registry."""
-    patterns = _RAW_PATTERNS.get(category, [])
-    if not patterns:
+    phrases = _READABLE_KEYWORDS.get(category)
+    if not phrases:
         return "technical challenges"
-    # Extract human-readable text from regex patterns
-    raw_pattern, _ = rng.choice(patterns)
-    # Strip regex anchors/metacharacters to get readable text
-    text = raw_pattern.replace(r"\b", "").replace(r"\s+", " ")
-    text = text.replace("?", "").replace("(", "").replace(")", "")
-    text = text.replace("[/ _-]", " ").replace("[ -]", " ")
-    text = text.replace(".*", " ").replace(r"\d{4}", "2026")
-    text = text.replace(r"\d", "1").replace("s?", "s")
-    return text.strip()
+    return rng.choice(phrases)
 
 
 class SyntheticDataGenerator:
@@ -173,45 +202,21 @@ class SyntheticDataGenerator:
         All 4 platforms are represented roughly equally.
         """
         posts: List[RawPost] = []
-        now = datetime.utcnow()
-
-        for i in range(self.count):
-            platform = PLATFORMS[i % len(PLATFORMS)]
-            author = self._rng.choice(_AUTHORS)
-
-            # Decide which category this post falls into
-            bucket = self._rng.random()
-
-            if bucket < 0.60:
-                # Full pass: pain keyword + maintainer context + negative sentiment
-                template = self._rng.choice(_TEMPLATES)
-                post = self._build_from_template(
-                    idx=i, template=template, platform=platform,
-                    author=author, now=now, negative=True,
-                )
-            elif bucket < 0.75:
-                # Fail: no maintainer context
-                template = self._rng.choice(_NON_MAINTAINER_TEMPLATES)
-                post = self._build_from_template(
-                    idx=i, template=template, platform=platform,
-                    author=author, now=now, negative=True,
-                )
-            elif bucket < 0.90:
-                # Fail: no pain keywords
-                template = self._rng.choice(_NO_PAIN_TEMPLATES)
-                post = self._build_from_template(
-                    idx=i, template=template, platform=platform,
-                    author=author, now=now, negative=False,
-                )
-            else:
-                # Fail: positive sentiment (will be caught by sentiment gate)
-                template = self._rng.choice(_TEMPLATES)
-                post = self._build_from_template(
-                    idx=i, template=template, platform=platform,
-                    author=author, now=now, negative=False,
-                    force_positive=True,
-                )
-
+        now = datetime.now(timezone.utc)
+
+        # Draw every post's bucket and author up front in two batched draws.
+        buckets = self._rng.choices(_BUCKETS, weights=_BUCKET_WEIGHTS, k=self.count)
+        authors = self._rng.choices(_AUTHORS, k=self.count)
+
+        for i, ((templates, negative, force_positive), author) in enumerate(
+            zip(buckets, authors)
+        ):
+            post = self._build_from_template(
+                idx=i, template=self._rng.choice(templates),
+                platform=PLATFORMS[i % len(PLATFORMS)],
+                author=author, now=now, negative=negative,
+                force_positive=force_positive,
+            )
             posts.append(post)
 
         return posts
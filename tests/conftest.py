@@ -6,7 +6,7 @@ import os
 import random
 import tempfile
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, List
 
 import pytest
 
@@ -26,9 +26,13 @@ def _deterministic_seed():
     yield
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture()
 def _freeze_time(monkeypatch):
-    """Freeze datetime.now()/utcnow() to a deterministic value."""
+    """Freeze datetime.now()/utcnow() to FROZEN_TIME (opt-in).
+
+    Only affects code that looks up ``datetime.datetime`` at call time; modules
+    that did ``from datetime import datetime`` keep the real class.
+    """
     import datetime as dt_module
 
     _real_datetime = datetime
@@ -43,26 +47,101 @@ def _freeze_time(monkeypatch):
             return FROZEN_TIME.replace(tzinfo=None)
 
     monkeypatch.setattr(dt_module, "datetime", FrozenDatetime)
-
-
-@pytest.fixture()
-def tmp_db(tmp_path):
-    """Return a Database instance backed by a temporary file."""
+    return FROZEN_TIME
+
+
+# ─── Post Factories ───
+
+# Constant fields shared by every factory-built post; callers pass the rest.
+_RAW_POST_BASE = {
+    "platform": "hackernews",
+    "author": "dev",
+    "followers": 500,
+    "author_karma": 500,
+    "upvotes": 100,
+    "score": 100,
+    "comments": 20,
+    "comment_count": 20,
+}
+
+_SCORED_POST_BASE = {
+    **_RAW_POST_BASE,
+    "title": "I maintain OSS and CI keeps failing",
+    "body": "I maintain this and CI keeps failing. I'm burned out.",
+    "pain_score": 3.0,
+    "sentiment": -0.5,
+    "raw_sentiment": -0.5,
+    "is_maintainer": True,
+    "is_maintainer_context": True,
+    "influence_norm": 0.6,
+    "engagement_norm": 0.7,
+    "pain_factor": 1.2,
+    "sentiment_factor": 1.5,
+    "maintainer_boost": 1.25,
+    "final_score": 0.75,
+    "signal_score": 0.75,
+    "source_tier": "live",
+    "provenance": "live",
+}
+
+
+def build_raw_post(**fields: Any):
+    """Return a RawPost from known-good data, overriding the base with *fields*.
+
+    ``model_construct`` skips field validation; post-init alias sync still runs.
+    """
+    from radar.models import RawPost
+
+    return RawPost.model_construct(**{**_RAW_POST_BASE, **fields})
+
+
+def build_scored_post(**fields: Any):
+    """Return a ScoredPost from known-good data (see :func:`build_raw_post`)."""
+    from radar.models import PainCategory, ScoredPost
+
+    fields.setdefault("pain_categories", [PainCategory.BURNOUT, PainCategory.CI_CD])
+    return ScoredPost.model_construct(**{**_SCORED_POST_BASE, **fields})
+
+
+@pytest.fixture(scope="session")
+def _session_db(tmp_path_factory):
+    """One migrated catalog shared by the whole session (see ``tmp_db``).
+
+    Under pytest-xdist each worker has its own session and basetemp, so
+    workers never share this file.
+    """
     from radar.storage.database import Database
 
-    db_path = str(tmp_path / "test_catalog.db")
-    db = Database(db_path)
+    db = Database(str(tmp_path_factory.mktemp("db") / "test_catalog.db"))
     yield db
     db.close()
 
 
 @pytest.fixture()
-def mock_settings(tmp_path):
+def tmp_db(_session_db):
+    """Return the shared Database, emptied again after each test.
+
+    Database reads on a second connection, so a SAVEPOINT rollback on the
+    writer would hide rows from reads; the tables are wiped instead.
+    """
+    yield _session_db
+    _session_db._conn.executescript(
+        """
+        DELETE FROM report_entries;
+        DELETE FROM reports;
+        DELETE FROM posts;
+        DELETE FROM sqlite_sequence;
+        """
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_settings(tmp_path_factory):
     """Return a Settings instance with safe test defaults."""
     from radar.config import Settings
 
     return Settings(
-        db_path=str(tmp_path / "test.db"),
+        db_path=str(tmp_path_factory.mktemp("settings") / "test.db"),
         email_enabled=False,
         reddit_enabled=False,
         influence_weight=0.4,
@@ -71,9 +150,9 @@ def mock_settings(tmp_path):
     )
 
 
-@pytest.fixture()
-def sample_raw_posts() -> List:
-    """Return a list of RawPosts that pass all filters."""
+@pytest.fixture(scope="module")
+def _sample_raw_posts_cached() -> List:
+    """Build the RawPosts that pass all filters once per module."""
     from radar.models import PainCategory, RawPost
 
     base_text = (
@@ -108,10 +187,24 @@ def sample_raw_posts() -> List:
     return posts
 
 
-@pytest.fixture()
-def sample_scored_posts(sample_raw_posts):
-    """Return scored versions of sample_raw_posts."""
+@pytest.fixture(scope="module")
+def _sample_scored_posts_cached(_sample_raw_posts_cached):
+    """Score the cached sample posts once per module."""
     from radar.ranking.scorer import SignalScorer
 
     scorer = SignalScorer()
-    return scorer.score_batch(sample_raw_posts)
+    return scorer.score_batch(
+        [p.model_copy(deep=True) for p in _sample_raw_posts_cached]
+    )
+
+
+@pytest.fixture()
+def sample_raw_posts(_sample_raw_posts_cached) -> List:
+    """Return a list of RawPosts that pass all filters (fresh copies per test)."""
+    return [p.model_copy(deep=True) for p in _sample_raw_posts_cached]
+
+
+@pytest.fixture()
+def sample_scored_posts(_sample_scored_posts_cached):
+    """Return scored versions of sample_raw_posts (fresh copies per test)."""
+    return [p.model_copy(deep=True) for p in _sample_scored_posts_cached]
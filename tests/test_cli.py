@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import List
 from unittest.mock import MagicMock, patch
@@ -10,45 +11,35 @@ import pytest
 from typer.testing import CliRunner
 
 from radar.cli import app
-from radar.models import DailyReport, PainCategory, ScoredPost, WeeklyReport
+from radar.models import DailyReport, ScoredPost, WeeklyReport
+from tests.conftest import build_scored_post
 
 
 runner = CliRunner()
 
 
+def _daily_args(tmp_path, *flags: str) -> List[str]:
+    """argv for ``radar daily`` against a throwaway DB, email disabled."""
+    return ["daily", "--db-path", str(tmp_path / "test.db"), *flags, "--no-email"]
+
+
 def make_scored_post(i: int = 1) -> ScoredPost:
-    return ScoredPost(
+    return build_scored_post(
         url=f"https://example.com/post-{i}",
         title=f"I maintain OSS and it is broken #{i}",
-        body="Burnout and CI/CD failures everywhere",
-        platform="hackernews",
-        author="dev",
-        followers=500,
-        author_karma=500,
-        upvotes=100,
-        score=100,
-        comments=20,
-        comment_count=20,
-        pain_categories=[PainCategory.BURNOUT, PainCategory.CI_CD],
-        pain_score=3.0,
-        sentiment=-0.5,
-        raw_sentiment=-0.5,
-        is_maintainer=True,
-        is_maintainer_context=True,
-        influence_norm=0.6,
-        engagement_norm=0.7,
-        pain_factor=1.2,
-        sentiment_factor=1.5,
-        maintainer_boost=1.25,
         final_score=0.9 - i * 0.05,
         signal_score=0.9 - i * 0.05,
-        source_tier="live",
-        provenance="live",
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_scored_post(i: int) -> ScoredPost:
+    """Build each numbered post once; the CLI only reads the mocked reports."""
+    return make_scored_post(i)
+
+
 def full_daily_report() -> DailyReport:
-    posts = [make_scored_post(i) for i in range(1, 6)]
+    posts = [_cached_scored_post(i) for i in range(1, 6)]
     return DailyReport(
         report_date=datetime(2024, 1, 15),
         generated_at=datetime(2024, 1, 15),
@@ -61,7 +52,7 @@ def full_daily_report() -> DailyReport:
 
 
 def partial_daily_report() -> DailyReport:
-    posts = [make_scored_post(i) for i in range(1, 3)]
+    posts = [_cached_scored_post(i) for i in range(1, 3)]
     return DailyReport(
         report_date=datetime(2024, 1, 15),
         generated_at=datetime(2024, 1, 15),
@@ -73,6 +64,26 @@ def partial_daily_report() -> DailyReport:
     )
 
 
+@pytest.fixture()
+def mock_run_daily(monkeypatch) -> MagicMock:
+    """Replace PipelineOrchestrator.run_daily for the duration of one test."""
+    from radar.pipeline import PipelineOrchestrator
+
+    mock = MagicMock()
+    monkeypatch.setattr(PipelineOrchestrator, "run_daily", mock)
+    return mock
+
+
+@pytest.fixture()
+def mock_run_weekly(monkeypatch) -> MagicMock:
+    """Replace PipelineOrchestrator.run_weekly for the duration of one test."""
+    from radar.pipeline import PipelineOrchestrator
+
+    mock = MagicMock()
+    monkeypatch.setattr(PipelineOrchestrator, "run_weekly", mock)
+    return mock
+
+
 # ---------------------------------------------------------------------------
 # stats command
 # ---------------------------------------------------------------------------
@@ -116,64 +127,17 @@ class TestScrapeCommand:
 
 
 class TestDailyCommand:
-    def test_daily_exits_zero_on_full_report(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock_run:
-            mock_run.return_value = full_daily_report()
-            result = runner.invoke(
-                app,
-                ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"],
-            )
-        # Full report (5 posts, is_partial=False) → exit 0
-        assert result.exit_code == 0
-
-    def test_daily_exits_one_on_partial_report(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock_run:
-            mock_run.return_value = partial_daily_report()
-            result = runner.invoke(
-                app,
-                ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"],
-            )
-        # Partial report → exit 1
-        assert result.exit_code == 1
-
-    def test_daily_exits_two_on_exception(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock_run:
-            mock_run.side_effect = RuntimeError("Fatal error")
-            result = runner.invoke(
-                app,
-                ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"],
-            )
-        assert result.exit_code == 2
-
-    def test_dry_run_flag_passed(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock_run:
-            mock_run.return_value = full_daily_report()
-            result = runner.invoke(
-                app,
-                [
-                    "daily",
-                    "--db-path", str(tmp_path / "test.db"),
-                    "--dry-run",
-                    "--no-email",
-                ],
-            )
-            _, kwargs = mock_run.call_args
-            assert kwargs.get("dry_run") is True
+    def test_dry_run_flag_passed(self, mock_run_daily, tmp_path):
+        mock_run_daily.return_value = full_daily_report()
+        result = runner.invoke(app, _daily_args(tmp_path, "--dry-run"))
+        _, kwargs = mock_run_daily.call_args
+        assert kwargs.get("dry_run") is True
 
-    def test_force_flag_passed(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock_run:
-            mock_run.return_value = full_daily_report()
-            result = runner.invoke(
-                app,
-                [
-                    "daily",
-                    "--db-path", str(tmp_path / "test.db"),
-                    "--force",
-                    "--no-email",
-                ],
-            )
-            _, kwargs = mock_run.call_args
-            assert kwargs.get("force") is True
+    def test_force_flag_passed(self, mock_run_daily, tmp_path):
+        mock_run_daily.return_value = full_daily_report()
+        result = runner.invoke(app, _daily_args(tmp_path, "--force"))
+        _, kwargs = mock_run_daily.call_args
+        assert kwargs.get("force") is True
 
 
 # ---------------------------------------------------------------------------
@@ -182,19 +146,19 @@ class TestDailyCommand:
 
 
 class TestWeeklyCommand:
-    def test_weekly_exits_zero(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_weekly") as mock_run:
-            mock_run.return_value = WeeklyReport(
-                week_start=datetime(2024, 1, 8),
-                entries=[make_scored_post(i) for i in range(5)],
-                top_posts=[make_scored_post(i) for i in range(5)],
-                platform_breakdown={"hackernews": 5},
-                category_breakdown={"burnout": 3},
-            )
-            result = runner.invoke(
-                app,
-                ["weekly", "--db-path", str(tmp_path / "test.db"), "--no-email"],
-            )
+    def test_weekly_exits_zero(self, mock_run_weekly, tmp_path):
+        posts = [_cached_scored_post(i) for i in range(5)]
+        mock_run_weekly.return_value = WeeklyReport(
+            week_start=datetime(2024, 1, 8),
+            entries=posts,
+            top_posts=posts,
+            platform_breakdown={"hackernews": 5},
+            category_breakdown={"burnout": 3},
+        )
+        result = runner.invoke(
+            app,
+            ["weekly", "--db-path", str(tmp_path / "test.db"), "--no-email"],
+        )
         assert result.exit_code == 0
 
 
@@ -204,15 +168,21 @@ class TestWeeklyCommand:
 
 
 class TestValidateCommand:
-    def test_validate_fails_gracefully_no_internet(self, tmp_path):
-        """validate command should exit 0 or 1 without crashing."""
-        # DB check will pass; network checks will likely fail in test env
+    def test_validate_fails_gracefully_no_internet(self, tmp_path, monkeypatch):
+        """validate command should exit 1 (not crash) when the network is down."""
+        import httpx
+
+        def _offline(url, **kwargs):
+            raise httpx.ConnectError("network disabled in tests")
+
+        # Fail the HN probe instantly instead of waiting on a real timeout
+        monkeypatch.setattr(httpx, "head", _offline)
         result = runner.invoke(
             app,
             ["validate", "--db-path", str(tmp_path / "test.db")],
         )
-        # Either 0 (all pass) or 1 (some fail) — not 2 (crash)
-        assert result.exit_code in (0, 1)
+        # Network check fails → 1 (some fail), not 2 (crash)
+        assert result.exit_code == 1
         # Output should contain a table
         assert "Database" in result.output or "Validation" in result.output
 
@@ -223,26 +193,20 @@ class TestValidateCommand:
 
 
 class TestExitCodes:
-    def test_exit_0_full_success(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock:
-            mock.return_value = full_daily_report()
-            result = runner.invoke(
-                app, ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"]
-            )
-        assert result.exit_code == 0
-
-    def test_exit_1_partial(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock:
-            mock.return_value = partial_daily_report()
-            result = runner.invoke(
-                app, ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"]
-            )
-        assert result.exit_code == 1
-
-    def test_exit_2_total_failure(self, tmp_path):
-        with patch("radar.pipeline.PipelineOrchestrator.run_daily") as mock:
-            mock.side_effect = Exception("boom")
-            result = runner.invoke(
-                app, ["daily", "--db-path", str(tmp_path / "test.db"), "--no-email"]
-            )
-        assert result.exit_code == 2
+    @pytest.mark.parametrize(
+        "factory,side_effect,expected",
+        [
+            (full_daily_report, None, 0),  # 5 posts, is_partial=False
+            (partial_daily_report, None, 1),  # partial report
+            (None, RuntimeError("Fatal error"), 2),  # pipeline raised
+        ],
+        ids=["full", "partial", "failure"],
+    )
+    def test_daily_exit_code(
+        self, mock_run_daily, tmp_path, factory, side_effect, expected
+    ):
+        if factory is not None:
+            mock_run_daily.return_value = factory()
+        mock_run_daily.side_effect = side_effect
+        result = runner.invoke(app, _daily_args(tmp_path))
+        assert result.exit_code == expected
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from contextlib import nullcontext
 
 import pytest
 from pydantic import ValidationError
@@ -14,77 +15,97 @@ def make_settings(**kwargs):
     return Settings(_env_file=None, **kwargs)
 
 
-class TestWeightValidation:
-    def test_valid_weights_sum_to_one(self):
-        s = make_settings(influence_weight=0.4, engagement_weight=0.6)
-        assert abs(s.influence_weight + s.engagement_weight - 1.0) < 1e-6
-
-    def test_invalid_weights_raise(self):
-        with pytest.raises(ValidationError, match="sum to 1.0"):
-            make_settings(influence_weight=0.5, engagement_weight=0.6)
+def _check_settings(kwargs: dict, expected_error: str | None) -> None:
+    """Build Settings from *kwargs*; expect a ValidationError matching *expected_error*."""
+    cm = (
+        pytest.raises(ValidationError, match=expected_error)
+        if expected_error
+        else nullcontext()
+    )
+    with cm:
+        s = make_settings(**kwargs)
+    if expected_error is None:
+        for field, value in kwargs.items():
+            assert getattr(s, field) == value
 
-    def test_equal_weights_valid(self):
-        s = make_settings(influence_weight=0.5, engagement_weight=0.5)
-        assert s.influence_weight == 0.5
 
-    def test_custom_valid_weights(self):
-        s = make_settings(influence_weight=0.3, engagement_weight=0.7)
-        assert abs(s.influence_weight + s.engagement_weight - 1.0) < 1e-6
+class TestWeightValidation:
+    @pytest.mark.parametrize(
+        "kwargs,expected_error",
+        [
+            ({"influence_weight": 0.4, "engagement_weight": 0.6}, None),
+            ({"influence_weight": 0.5, "engagement_weight": 0.6}, "sum to 1.0"),
+            ({"influence_weight": 0.5, "engagement_weight": 0.5}, None),
+            ({"influence_weight": 0.3, "engagement_weight": 0.7}, None),
+        ],
+        ids=["default-split", "over-one", "equal", "custom"],
+    )
+    def test_weights(self, kwargs, expected_error):
+        _check_settings(kwargs, expected_error)
 
 
 class TestSMTPValidation:
-    def test_email_disabled_no_smtp_required(self):
-        """No SMTP validation fires when email_enabled=False."""
-        s = make_settings(email_enabled=False)
-        assert not s.email_enabled
-
-    def test_email_enabled_requires_recipients(self):
-        with pytest.raises(ValidationError, match="RADAR_EMAIL_TO"):
-            make_settings(
-                email_enabled=True,
-                smtp_host="smtp.example.com",
-                smtp_user="user",
-                smtp_password="pass",
-                # no email_to
-            )
-
-    def test_email_enabled_localhost_no_user_ok(self):
-        """Localhost without smtp_user is valid — sendmail fallback handles it."""
-        s = make_settings(
-            email_enabled=True,
-            smtp_host="localhost",
-            email_to=["test@example.com"],
-        )
-        assert s.email_enabled is True
-
-    def test_email_enabled_with_all_credentials_ok(self):
-        s = make_settings(
-            email_enabled=True,
-            smtp_host="smtp.example.com",
-            smtp_port=587,
-            smtp_user="user@example.com",
-            smtp_password="secret",
-            email_to=["recipient@example.com"],
-        )
-        assert s.email_enabled is True
+    @pytest.mark.parametrize(
+        "kwargs,expected_error",
+        [
+            # No SMTP validation fires when email_enabled=False
+            ({"email_enabled": False}, None),
+            (
+                {
+                    "email_enabled": True,
+                    "smtp_host": "smtp.example.com",
+                    "smtp_user": "user",
+                    "smtp_password": "pass",
+                    # no email_to
+                },
+                "RADAR_EMAIL_TO",
+            ),
+            # Localhost without smtp_user is valid — sendmail fallback handles it
+            (
+                {
+                    "email_enabled": True,
+                    "smtp_host": "localhost",
+                    "email_to": ["test@example.com"],
+                },
+                None,
+            ),
+            (
+                {
+                    "email_enabled": True,
+                    "smtp_host": "smtp.example.com",
+                    "smtp_port": 587,
+                    "smtp_user": "user@example.com",
+                    "smtp_password": "secret",
+                    "email_to": ["recipient@example.com"],
+                },
+                None,
+            ),
+        ],
+        ids=["disabled", "no-recipients", "localhost-no-user", "full-credentials"],
+    )
+    def test_smtp(self, kwargs, expected_error):
+        _check_settings(kwargs, expected_error)
 
 
 class TestRedditValidation:
-    def test_reddit_disabled_no_creds_ok(self):
-        s = make_settings(reddit_enabled=False)
-        assert not s.reddit_enabled
-
-    def test_reddit_enabled_requires_credentials(self):
-        with pytest.raises(ValidationError, match="RADAR_REDDIT_CLIENT"):
-            make_settings(reddit_enabled=True)
-
-    def test_reddit_enabled_with_creds_ok(self):
-        s = make_settings(
-            reddit_enabled=True,
-            reddit_client_id="abc",
-            reddit_client_secret="xyz",
-        )
-        assert s.reddit_enabled is True
+    @pytest.mark.parametrize(
+        "kwargs,expected_error",
+        [
+            ({"reddit_enabled": False}, None),
+            ({"reddit_enabled": True}, "RADAR_REDDIT_CLIENT"),
+            (
+                {
+                    "reddit_enabled": True,
+                    "reddit_client_id": "abc",
+                    "reddit_client_secret": "xyz",
+                },
+                None,
+            ),
+        ],
+        ids=["disabled", "missing-credentials", "with-credentials"],
+    )
+    def test_reddit(self, kwargs, expected_error):
+        _check_settings(kwargs, expected_error)
 
 
 class TestEmailListParser:
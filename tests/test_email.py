@@ -7,7 +7,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from radar.models import DailyReport, PainCategory, ScoredPost, WeeklyReport
+from radar.models import DailyReport, ScoredPost, WeeklyReport
+from tests.conftest import build_scored_post
 
 
 def make_scored_post(
@@ -15,29 +16,9 @@ def make_scored_post(
     signal_score: float = 0.75,
     source_tier: str = "live",
 ) -> ScoredPost:
-    return ScoredPost(
+    return build_scored_post(
         url=f"https://example.com/post-{rank}",
         title=f"OSS Burnout Story #{rank}",
-        body="I maintain this and CI keeps failing. I'm burned out.",
-        platform="hackernews",
-        author="dev",
-        followers=500,
-        author_karma=500,
-        upvotes=100,
-        score=100,
-        comments=20,
-        comment_count=20,
-        pain_categories=[PainCategory.BURNOUT, PainCategory.CI_CD],
-        pain_score=3.0,
-        sentiment=-0.5,
-        raw_sentiment=-0.5,
-        is_maintainer=True,
-        is_maintainer_context=True,
-        influence_norm=0.6,
-        engagement_norm=0.7,
-        pain_factor=1.2,
-        sentiment_factor=1.5,
-        maintainer_boost=1.25,
         final_score=signal_score,
         signal_score=signal_score,
         source_tier=source_tier,
@@ -87,7 +68,7 @@ def weekly_report():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def mock_settings():
     from radar.config import Settings
     return Settings(
@@ -101,12 +82,17 @@ def mock_settings():
     )
 
 
-class TestDailyTemplateRendering:
-    def test_renders_without_error(self, daily_report_full, mock_settings):
-        from radar.email.sender import EmailSender
+@pytest.fixture(scope="module")
+def email_sender(mock_settings):
+    """One EmailSender per module so Jinja2's template cache stays warm."""
+    from radar.email.sender import EmailSender
 
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    return EmailSender(mock_settings)
+
+
+class TestDailyTemplateRendering:
+    def test_renders_without_error(self, daily_report_full, email_sender):
+        html = email_sender._render(
             "daily.html.j2",
             {"report": daily_report_full, "date_str": "2024-01-15"},
         )
@@ -120,34 +106,23 @@ class TestDailyTemplateRendering:
         assert date_str == "2024-01-15"
         assert expected == "[OSS Radar] Daily Intel — 2024-01-15"
 
-    def test_partial_banner_shown_in_partial_report(
-        self, daily_report_partial, mock_settings
-    ):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    def test_partial_banner_shown_in_partial_report(self, daily_report_partial, email_sender):
+        html = email_sender._render(
             "daily.html.j2",
             {"report": daily_report_partial, "date_str": "2024-01-15"},
         )
         assert "Partial Report" in html or "partial" in html.lower()
 
-    def test_no_partial_banner_in_full_report(self, daily_report_full, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    def test_no_partial_banner_in_full_report(self, daily_report_full, email_sender):
+        html = email_sender._render(
             "daily.html.j2",
             {"report": daily_report_full, "date_str": "2024-01-15"},
         )
         # Should not show partial banner for a full report
         assert "Partial Report" not in html
 
-    def test_rank_medals_present(self, daily_report_full, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    def test_rank_medals_present(self, daily_report_full, email_sender):
+        html = email_sender._render(
             "daily.html.j2",
             {"report": daily_report_full, "date_str": "2024-01-15"},
         )
@@ -156,10 +131,7 @@ class TestDailyTemplateRendering:
         assert "#2" in html
         assert "#3" in html
 
-    def test_empty_report_renders(self, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
+    def test_empty_report_renders(self, email_sender):
         empty_report = DailyReport(
             report_date=datetime(2024, 1, 15),
             entries=[],
@@ -167,7 +139,7 @@ class TestDailyTemplateRendering:
             entry_count=0,
             is_partial=True,
         )
-        html = sender._render(
+        html = email_sender._render(
             "daily.html.j2",
             {"report": empty_report, "date_str": "2024-01-15"},
         )
@@ -175,11 +147,8 @@ class TestDailyTemplateRendering:
 
 
 class TestWeeklyTemplateRendering:
-    def test_renders_without_error(self, weekly_report, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    def test_renders_without_error(self, weekly_report, email_sender):
+        html = email_sender._render(
             "weekly.html.j2",
             {"report": weekly_report, "date_str": "2024-01-08"},
         )
@@ -192,20 +161,14 @@ class TestWeeklyTemplateRendering:
         subject = f"[OSS Radar] Weekly Digest — Week of {date_str}"
         assert subject == "[OSS Radar] Weekly Digest — Week of 2024-01-08"
 
-    def test_platform_breakdown_shown(self, weekly_report, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
-        html = sender._render(
+    def test_platform_breakdown_shown(self, weekly_report, email_sender):
+        html = email_sender._render(
             "weekly.html.j2",
             {"report": weekly_report, "date_str": "2024-01-08"},
         )
         assert "hackernews" in html
 
-    def test_empty_weekly_renders(self, mock_settings):
-        from radar.email.sender import EmailSender
-
-        sender = EmailSender(mock_settings)
+    def test_empty_weekly_renders(self, email_sender):
         empty = WeeklyReport(
             week_start=datetime(2024, 1, 8),
             entries=[],
@@ -213,7 +176,7 @@ class TestWeeklyTemplateRendering:
             platform_breakdown={},
             category_breakdown={},
         )
-        html = sender._render(
+        html = email_sender._render(
             "weekly.html.j2",
             {"report": empty, "date_str": "2024-01-08"},
         )
@@ -221,7 +184,7 @@ class TestWeeklyTemplateRendering:
 
 
 class TestEmailMIMEStructure:
-    def test_build_mime_has_both_parts(self, daily_report_full, mock_settings):
+    def test_build_mime_has_both_parts(self, mock_settings):
         from radar.email.sender import EmailSender
 
         sender = EmailSender(mock_settings)
@@ -248,6 +211,13 @@ class TestEmailMIMEStructure:
         assert "Hello" in plain
         assert "World & beyond" in plain
 
+    def test_plaintext_fallback_is_stable_across_calls(self, mock_settings):
+        from radar.email.sender import EmailSender
+
+        html = "<p>A&nbsp;&lt;b&gt;</p>\n\n\n\n<p>&quot;done&quot;</p>"
+        results = {EmailSender._plaintext_fallback(html) for _ in range(10)}
+        assert results == {'A <b>\n\n"done"'}
+
     def test_dry_run_skips_smtp(self, daily_report_full, mock_settings):
         from radar.email.sender import EmailSender
 
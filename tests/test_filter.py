@@ -7,6 +7,7 @@ from datetime import datetime
 import pytest
 
 from radar.models import PainCategory, RawPost
+from tests.conftest import build_raw_post
 
 
 def make_post(
@@ -17,26 +18,16 @@ def make_post(
     sentiment: float = 0.0,
     pain_categories: list | None = None,
 ) -> RawPost:
-    p = RawPost(
+    return build_raw_post(
         url=url,
         title=title,
         body=body,
-        platform="hackernews",
-        author="user",
-        followers=100,
-        author_karma=100,
-        upvotes=50,
-        score=50,
-        comments=10,
-        comment_count=10,
         is_maintainer=is_maintainer,
         is_maintainer_context=is_maintainer,
         sentiment=sentiment,
         raw_sentiment=sentiment,
+        pain_categories=pain_categories or [],
     )
-    if pain_categories:
-        p.pain_categories = pain_categories
-    return p
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +75,35 @@ class TestKeywordFilterLayer:
         from radar.ranking.keywords import COMPILED_PATTERNS
         assert len(COMPILED_PATTERNS) == 15
 
+    @pytest.mark.parametrize("backend", ["re", "hyperscan"])
+    def test_keyword_hits_match_per_pattern_weights(self, backend, monkeypatch):
+        from radar.ranking import keywords
+        from radar.ranking.keywords import COMPILED_PATTERNS, count_keyword_hits
+        from radar.synthetic import SyntheticDataGenerator
+
+        if backend == "re":
+            monkeypatch.setattr(keywords, "_hyperscan_db", lambda: None)
+        elif keywords._hyperscan_db() is None:
+            pytest.skip("hyperscan not installed")
+
+        texts = [
+            f"{post.title} {post.body}"
+            for post in SyntheticDataGenerator(count=200, seed=7).generate()
+        ]
+        # \s is Unicode-aware: NBSP and em space separate words like a space
+        texts += [text.replace(" ", sep) for text in texts[:50] for sep in ("\xa0", "\u2003")]
+        for text in texts:
+            expected = {}
+            for cat, compiled in COMPILED_PATTERNS.items():
+                weight = sum(w for p, w in compiled if p.search(text))
+                if weight:
+                    expected[cat] = weight
+            assert count_keyword_hits(text) == expected
+        assert count_keyword_hits("I am burned\xa0out") == {PainCategory.BURNOUT: 3.0}
+        assert count_keyword_hits("I am burned\u2003out") == {PainCategory.BURNOUT: 3.0}
+        # \b is Unicode-aware: no boundary between "é" and "b"
+        assert count_keyword_hits("éburnout") == {}
+
     def test_corporate_exploitation_keyword(self):
         from radar.ranking.filters import KeywordFilter
         kf = KeywordFilter()
@@ -149,6 +169,15 @@ class TestMaintainerContextFilterLayer:
         from radar.ranking.keywords import MAINTAINER_PATTERNS
         assert len(MAINTAINER_PATTERNS) >= 10
 
+    def test_fused_pattern_agrees_with_individual_patterns(self):
+        from radar.ranking.keywords import MAINTAINER_FUSED, MAINTAINER_PATTERNS
+        from radar.synthetic import SyntheticDataGenerator
+
+        for post in SyntheticDataGenerator(count=200, seed=7).generate():
+            text = f"{post.title} {post.body}"
+            expected = any(p.search(text) for p in MAINTAINER_PATTERNS)
+            assert (MAINTAINER_FUSED.search(text) is not None) == expected
+
 
 # ---------------------------------------------------------------------------
 # Layer 3: SentimentFilter
@@ -180,6 +209,29 @@ class TestSentimentFilterLayer:
         score = sf._combined_score("I maintain my project")
         assert isinstance(score, float)
 
+    def test_textblob_skipped_when_vader_rules_post_out(self, monkeypatch):
+        from radar.ranking.filters import SentimentFilter
+        calls = []
+        monkeypatch.setattr(
+            SentimentFilter, "_textblob_score", staticmethod(lambda text: calls.append(text) or -1.0)
+        )
+        happy = make_post(title="Love it", body="Excellent! Amazing! Perfect! Love it!")
+        sad = make_post(title="Burned out", body="This is awful, terrible and broken.")
+        result = SentimentFilter().apply([happy, sad])
+        assert result == [sad]
+        assert calls == ["Burned out This is awful, terrible and broken."]
+        assert happy.sentiment > 0
+
+    def test_vader_analyzer_shared_across_instances(self):
+        from radar.ranking.filters import SentimentFilter
+        assert SentimentFilter()._vader is SentimentFilter()._vader
+
+    def test_long_text_scored_in_full(self):
+        from radar.ranking.filters import SentimentFilter
+        sf = SentimentFilter()
+        head = "x " * 5000
+        assert sf._combined_score(head + "This is awful, terrible and broken.") < 0
+
 
 # ---------------------------------------------------------------------------
 # FilterPipeline end-to-end
@@ -212,6 +264,30 @@ class TestFilterPipelineEndToEnd:
         result = fp.apply([post])
         assert result == []
 
+    def test_sentiment_only_scores_earlier_survivors(self, monkeypatch):
+        from radar.ranking.filters import FilterPipeline, SentimentFilter
+        scored = []
+        monkeypatch.setattr(
+            SentimentFilter, "_vader_score", lambda self, text: scored.append(text) or -1.0
+        )
+        posts = [
+            make_post(title="My Python tutorial", body="Learn Python step by step."),
+            make_post(title="Burned out", body="Nobody helps with the docs."),
+            make_post(title="Burned out", body="I maintain this library alone."),
+        ]
+        result = FilterPipeline().apply(posts)
+        assert result == [posts[2]]
+        assert scored == ["Burned out I maintain this library alone."]
+
+    def test_pipeline_accepts_lazy_input(self):
+        from radar.ranking.filters import FilterPipeline
+        posts = [
+            make_post(title="Burned out", body="I maintain this library. It is awful and broken."),
+            make_post(title="My Python tutorial", body="Learn Python step by step."),
+        ]
+        result = FilterPipeline().apply(iter(posts))
+        assert result == [posts[0]]
+
     def test_positive_sentiment_rejected(self):
         """A post with positive sentiment should not pass layer 3."""
         from radar.ranking.filters import FilterPipeline, SentimentFilter
@@ -51,6 +51,12 @@ class TestLLMBackendDryRun:
 
 
 class TestLLMBackendGitHubModels:
+    @pytest.fixture(autouse=True)
+    def _no_token(self, monkeypatch):
+        """Without a token in the environment, requests go through ``gh api``."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+
     @patch("asyncio.create_subprocess_exec")
     def test_github_models_success(self, mock_exec):
         api_response = {
@@ -100,6 +106,91 @@ class TestLLMBackendGitHubModels:
         with pytest.raises(RuntimeError, match="All LLM backends failed"):
             backend.complete_sync([{"role": "user", "content": "test"}])
 
+    def _mock_http(self, monkeypatch, handler):
+        import httpx
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setattr(
+            "radar.llm.httpx.AsyncClient",
+            lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+        )
+
+    @patch("asyncio.create_subprocess_exec")
+    def test_token_uses_http_not_subprocess(self, mock_exec, monkeypatch):
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={
+                "choices": [{"message": {"content": "Over HTTP"}}],
+                "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+            })
+
+        self._mock_http(monkeypatch, handler)
+
+        async def _two_calls():
+            backend = LLMBackend()
+            first = await backend.complete([{"role": "user", "content": "a"}])
+            client = backend._http_client
+            await backend.complete([{"role": "user", "content": "b"}])
+            assert backend._http_client is client  # pooled across requests
+            await backend.aclose()
+            return first
+
+        result = asyncio.run(_two_calls())
+        assert result.content == "Over HTTP"
+        assert result.tokens_in == 7
+        assert len(seen) == 2
+        assert seen[0].headers["Authorization"] == "Bearer ghp_test"
+        assert json.loads(seen[0].content)["messages"][0]["content"] == "a"
+        mock_exec.assert_not_called()
+
+    def test_complete_sync_closes_its_client(self, monkeypatch):
+        import httpx
+
+        clients = []
+        real_client = httpx.AsyncClient
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+
+        def make_client(**kw):
+            client = real_client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json={
+                    "choices": [{"message": {"content": "ok"}}],
+                })),
+                **kw,
+            )
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr("radar.llm.httpx.AsyncClient", make_client)
+
+        backend = LLMBackend()
+        for _ in range(2):
+            assert backend.complete_sync([{"role": "user", "content": "x"}]).content == "ok"
+
+        # One client per run_sync loop, each closed before its loop ended
+        assert len(clients) == 2
+        assert all(client.is_closed for client in clients)
+        assert backend._http_client is None
+
+    @patch("asyncio.create_subprocess_exec")
+    def test_http_failure_falls_to_amplifier(self, mock_exec, monkeypatch):
+        import httpx
+
+        self._mock_http(monkeypatch, lambda request: httpx.Response(401, text="bad token"))
+        amp_proc = AsyncMock()
+        amp_proc.communicate.return_value = (b"Amplifier summary", b"")
+        amp_proc.returncode = 0
+        mock_exec.return_value = amp_proc
+
+        backend = LLMBackend()
+        result = backend.complete_sync([{"role": "user", "content": "test"}])
+        assert result.content == "Amplifier summary"
+        assert mock_exec.call_args[0][:3] == ("uv", "run", "amplifier")
+
 
 # ---------------------------------------------------------------------------
 # Excerpt helper tests
@@ -123,6 +214,10 @@ class TestExcerpt:
     def test_newlines_stripped(self):
         assert "\n" not in _excerpt("line1\nline2\nline3")
 
+    def test_long_body_with_newlines_truncated_at_word(self):
+        body = "first line\nsecond line\n" + "x" * 5000
+        assert _excerpt(body, max_len=30) == "first line second line..."
+
 
 # ---------------------------------------------------------------------------
 # Summarizer tests
@@ -146,10 +241,10 @@ class TestSummarizePosts:
         assert len(result) == 1
         assert result[0].llm_summary == "[DRY-RUN] No LLM call made."
 
-    @patch("radar.summarizer.LLMBackend")
+    @patch("radar.summarizer.LLMBackend", autospec=True)
     def test_llm_failure_falls_back_to_excerpt(self, MockBackend):
         instance = MockBackend.return_value
-        instance.complete_sync.side_effect = RuntimeError("fail")
+        instance.complete = AsyncMock(side_effect=RuntimeError("fail"))
 
         post = self._make_post(body="A" * 200)
         result = summarize_posts([post])
@@ -158,25 +253,29 @@ class TestSummarizePosts:
         assert result[0].llm_summary != ""
         assert len(result[0].llm_summary) <= 120
 
-    @patch("radar.summarizer.LLMBackend")
+    @patch("radar.summarizer.LLMBackend", autospec=True)
     def test_successful_summary(self, MockBackend):
         instance = MockBackend.return_value
-        instance.complete_sync.return_value = LLMResponse(
+        instance.complete = AsyncMock(return_value=LLMResponse(
             content="Maintainer struggles with CI/CD pipeline reliability.",
             model="test",
-        )
+        ))
 
         post = self._make_post()
         result = summarize_posts([post])
         assert result[0].llm_summary == "Maintainer struggles with CI/CD pipeline reliability."
 
-    @patch("radar.summarizer.LLMBackend")
+    @patch("radar.summarizer.LLMBackend", autospec=True)
     def test_multiple_posts_partial_failure(self, MockBackend):
         instance = MockBackend.return_value
-        instance.complete_sync.side_effect = [
-            LLMResponse(content="Good summary", model="test"),
-            RuntimeError("fail"),
-        ]
+
+        async def _complete(messages, **kwargs):
+            # Requests run concurrently, so key the outcome on the post body.
+            if "B" * 200 in messages[1]["content"]:
+                raise RuntimeError("fail")
+            return LLMResponse(content="Good summary", model="test")
+
+        instance.complete = _complete
 
         posts = [self._make_post(), self._make_post(body="B" * 200)]
         result = summarize_posts(posts)
@@ -184,6 +283,52 @@ class TestSummarizePosts:
         assert result[1].llm_summary != ""  # excerpt fallback
         assert len(result[1].llm_summary) <= 120
 
+    @patch("radar.summarizer.LLMBackend", autospec=True)
+    def test_batch_summarized_in_one_request(self, MockBackend):
+        instance = MockBackend.return_value
+        instance.complete = AsyncMock(return_value=LLMResponse(
+            content='```json\n["First pain.", "Second pain."]\n```', model="test",
+        ))
+
+        posts = [self._make_post(title="A"), self._make_post(title="B")]
+        result = summarize_posts(posts)
+        assert [p.llm_summary for p in result] == ["First pain.", "Second pain."]
+        instance.complete.assert_awaited_once()
+        payload = json.loads(instance.complete.await_args.args[0][1]["content"])
+        assert [item["title"] for item in payload] == ["A", "B"]
+
+    @patch("radar.summarizer.LLMBackend", autospec=True)
+    def test_unusable_batch_reply_retried_per_post(self, MockBackend):
+        async def _complete(messages, **kwargs):
+            if messages[0]["content"].startswith("Summarize each"):
+                return LLMResponse(content='["only one summary"]', model="test")
+            return LLMResponse(content="Single summary", model="test")
+
+        MockBackend.return_value.complete = _complete
+        posts = [self._make_post(), self._make_post()]
+        result = summarize_posts(posts)
+        assert [p.llm_summary for p in result] == ["Single summary"] * 2
+
+    @patch("radar.summarizer._BATCH_SIZE", 1)
+    @patch("radar.summarizer.LLMBackend", autospec=True)
+    def test_posts_summarized_concurrently(self, MockBackend):
+        import asyncio
+
+        barrier = asyncio.Barrier(3)
+
+        async def _complete(messages, **kwargs):
+            # Times out unless all three requests are in flight together.
+            async with asyncio.timeout(5):
+                await barrier.wait()
+            return LLMResponse(content=messages[1]["content"].split("\n")[0], model="test")
+
+        MockBackend.return_value.complete = _complete
+        posts = [self._make_post(title=f"Post {i}") for i in range(3)]
+        result = summarize_posts(posts)
+        assert [p.llm_summary for p in result] == [
+            "Title: Post 0", "Title: Post 1", "Title: Post 2"
+        ]
+
     def test_empty_posts_list(self):
         result = summarize_posts([], dry_run=True)
         assert result == []
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import List
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from radar.models import PainCategory, RawPost, ScoredPost
+from radar.models import RawPost, ScoredPost
+from tests.conftest import build_scored_post
 
 
 def make_scored_post(
@@ -16,29 +18,8 @@ def make_scored_post(
     signal_score: float = 0.5,
     source_tier: str = "live",
 ) -> ScoredPost:
-    return ScoredPost(
+    return build_scored_post(
         url=url,
-        title="I maintain OSS and CI keeps failing",
-        body="I'm the author of this library and it needs help",
-        platform="hackernews",
-        author="dev",
-        followers=200,
-        author_karma=200,
-        upvotes=80,
-        score=80,
-        comments=15,
-        comment_count=15,
-        pain_categories=[PainCategory.CI_CD, PainCategory.BURNOUT],
-        pain_score=2.0,
-        sentiment=-0.4,
-        raw_sentiment=-0.4,
-        is_maintainer=True,
-        is_maintainer_context=True,
-        influence_norm=0.5,
-        engagement_norm=0.5,
-        pain_factor=1.2,
-        sentiment_factor=1.4,
-        maintainer_boost=1.0,
         final_score=signal_score,
         signal_score=signal_score,
         source_tier=source_tier,
@@ -46,17 +27,32 @@ def make_scored_post(
     )
 
 
+@dataclass
+class StubScraper:
+    """Minimal scraper double; use MagicMock only where calls are asserted."""
+
+    platform: str
+    posts: List[ScoredPost] = field(default_factory=list)
+
+    def scrape(self) -> List[ScoredPost]:
+        return self.posts
+
+
+class BadScraper:
+    platform = "bad"
+
+    def scrape(self) -> List[ScoredPost]:
+        raise Exception("Network down")
+
+
 @pytest.fixture()
 def mock_scraper_with_posts():
-    """Create a mock scraper that returns 6 posts."""
-    scraper = MagicMock()
-    scraper.platform = "hackernews"
+    """Create a stub scraper that returns 6 posts."""
     posts = [
         make_scored_post(url=f"https://hn.example.com/{i}", signal_score=1.0 - i * 0.1)
         for i in range(6)
     ]
-    scraper.scrape.return_value = posts
-    return scraper, posts
+    return StubScraper("hackernews", posts), posts
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +110,49 @@ class TestBackfillManager:
         result = manager.ensure_five(posts)
         assert len(result) == 2  # can't find more
 
+    def test_partial_rung_fills_from_old_unreported_posts(self, tmp_db):
+        """Posts older than 30 days are used as the last-resort partial tier."""
+        from radar.pipeline import BackfillManager
+
+        old = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        for i in range(4):
+            p = make_scored_post(url=f"https://example.com/old/{i}")
+            p.scraped_at = old
+            tmp_db.upsert_post(p)
+
+        manager = BackfillManager(tmp_db)
+        live = [make_scored_post(url="https://example.com/live/0")]
+        result = manager.ensure_five(live)
+        assert len(result) == 5
+        assert [p.source_tier for p in result[1:]] == ["partial"] * 4
+
+    def test_archive_tiers_come_from_one_ordered_query(self, tmp_db):
+        """Recent posts outrank older ones; live posts already stored are skipped."""
+        from radar.pipeline import BackfillManager
+
+        now = datetime.now(timezone.utc)
+        live = make_scored_post(url="https://example.com/live/0", signal_score=0.9)
+        tmp_db.upsert_post(live)
+        for url, days_old, score in [
+            ("https://example.com/recent", 2, 0.2),
+            ("https://example.com/older-high", 20, 0.95),
+            ("https://example.com/older-low", 20, 0.1),
+        ]:
+            p = make_scored_post(url=url, signal_score=score)
+            p.scraped_at = now - timedelta(days=days_old)
+            tmp_db.upsert_post(p)
+
+        result = BackfillManager(tmp_db).ensure_five([live])
+        assert [p.url for p in result] == [
+            "https://example.com/live/0",
+            "https://example.com/recent",
+            "https://example.com/older-high",
+            "https://example.com/older-low",
+        ]
+        assert [p.source_tier for p in result] == [
+            "live", "archive-7d", "archive-30d", "archive-30d"
+        ]
+
     def test_source_tier_set_correctly_for_live(self, tmp_db):
         from radar.pipeline import BackfillManager
 
@@ -143,14 +182,10 @@ class TestPipelineOrchestrator:
             for i in range(5)
         ]
 
-        mock_scraper = MagicMock()
-        mock_scraper.platform = "hackernews"
-        mock_scraper.scrape.return_value = []
-
         pipeline = PipelineOrchestrator(
             config=mock_settings,
             db=tmp_db,
-            scrapers=[mock_scraper],
+            scrapers=[StubScraper("hackernews")],
         )
 
         # Monkey-patch _rank to return scored posts directly
@@ -208,24 +243,45 @@ class TestPipelineOrchestrator:
         """A failing scraper does not crash the pipeline."""
         from radar.pipeline import PipelineOrchestrator
 
-        bad_scraper = MagicMock()
-        bad_scraper.platform = "bad"
-        bad_scraper.scrape.side_effect = Exception("Network down")
-
-        good_scraper = MagicMock()
-        good_scraper.platform = "good"
-        good_scraper.scrape.return_value = []
-
         pipeline = PipelineOrchestrator(
             config=mock_settings,
             db=tmp_db,
-            scrapers=[bad_scraper, good_scraper],
+            scrapers=[BadScraper(), StubScraper("good")],
         )
 
         # Should not raise
         report = pipeline.run_daily(dry_run=True, force=True)
         assert report is not None
 
+    def test_scrapers_run_concurrently_in_stable_order(self, tmp_db, mock_settings):
+        import threading
+
+        from radar.pipeline import PipelineOrchestrator
+
+        barrier = threading.Barrier(3, timeout=5)  # breaks if scrapers run serially
+
+        def _scrape(platform):
+            def scrape():
+                barrier.wait()
+                if platform == "devto":
+                    raise RuntimeError("Network down")
+                return [make_scored_post(url=f"https://example.com/{platform}")]
+            return scrape
+
+        scrapers = []
+        for platform in ["hackernews", "devto", "lobsters"]:
+            scraper = MagicMock()
+            scraper.platform = platform
+            scraper.scrape.side_effect = _scrape(platform)
+            scrapers.append(scraper)
+
+        pipeline = PipelineOrchestrator(config=mock_settings, db=tmp_db, scrapers=scrapers)
+        posts, statuses = pipeline._collect()
+        assert [p.url for p in posts] == [
+            "https://example.com/hackernews", "https://example.com/lobsters"
+        ]
+        assert statuses == {"hackernews": "ok", "devto": "failed", "lobsters": "ok"}
+
     def test_weekly_pipeline_returns_report(self, tmp_db, mock_settings):
         from radar.pipeline import PipelineOrchestrator
 
@@ -347,3 +347,12 @@ class TestSignalScorer:
 
         result = SignalScorer._log10_norm(100.0, 100.0)
         assert abs(result - 1.0) < 1e-9
+
+    @pytest.mark.parametrize("value,max_value", [(0.0, 0.0), (5.0, 0.0), (3.0, 100.0), (100.0, 100.0)])
+    def test_scaled_log10_matches_log10_norm(self, value, max_value):
+        import math
+
+        from radar.ranking.scorer import SignalScorer
+
+        denom = math.log10(max_value + 1)
+        assert SignalScorer._scaled_log10(value, denom) == SignalScorer._log10_norm(value, max_value)
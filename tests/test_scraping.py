@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Callable
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _reset_default_clients():
+    """Close the shared HTTP clients that scrapers built without a client create."""
+    yield
+    from radar.scraping.http import _close_default_clients
+
+    _close_default_clients()
+
+
 @pytest.fixture()
 def settings(tmp_path):
     from radar.config import Settings
@@ -19,11 +29,33 @@ def settings(tmp_path):
     )
 
 
-@pytest.fixture()
-def mock_client():
-    """Return a mock SafeHTTPClient."""
-    client = MagicMock()
-    return client
+class StubResponse:
+    """Just the part of an httpx.Response the scrapers read."""
+
+    def __init__(self, data: Any) -> None:
+        self.content = json.dumps(data).encode()
+
+
+class StubClient:
+    """Stand-in for SafeHTTPClient whose get() is the given callable."""
+
+    def __init__(self, get: Callable[..., StubResponse]) -> None:
+        self.get = get
+
+
+def serving(data: Any) -> StubClient:
+    """Client that answers every GET with *data* as JSON."""
+    response = StubResponse(data)
+    return StubClient(lambda url, **kwargs: response)
+
+
+def failing(message: str) -> StubClient:
+    """Client whose every GET raises."""
+
+    def get(url: str, **kwargs: Any) -> StubResponse:
+        raise Exception(message)
+
+    return StubClient(get)
 
 
 # ---------------------------------------------------------------------------
@@ -32,11 +64,10 @@ def mock_client():
 
 
 class TestHNScraper:
-    def test_fetch_returns_raw_posts(self, settings, mock_client):
+    def test_fetch_returns_raw_posts(self, settings):
         from radar.scraping.hackernews import HNScraper
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        client = serving({
             "hits": [
                 {
                     "objectID": "12345",
@@ -50,10 +81,9 @@ class TestHNScraper:
                     "url": "https://news.ycombinator.com/item?id=12345",
                 }
             ]
-        }
-        mock_client.get.return_value = mock_response
+        })
 
-        scraper = HNScraper(settings, mock_client)
+        scraper = HNScraper(settings, client)
         posts = scraper.fetch_raw()
 
         assert len(posts) > 0
@@ -62,21 +92,38 @@ class TestHNScraper:
         assert post.upvotes == 150
         assert post.comments == 42
         assert post.author == "oss_dev"
+        assert post.scraped_at.tzinfo is not None
+        assert post.created_utc == datetime(2024, 1, 15, 10, tzinfo=timezone.utc)
 
-    def test_scrape_isolates_errors(self, settings, mock_client):
+    def test_scrape_isolates_errors(self, settings):
         from radar.scraping.hackernews import HNScraper
 
-        mock_client.get.side_effect = Exception("Network error")
-        scraper = HNScraper(settings, mock_client)
+        client = failing("Network error")
+        scraper = HNScraper(settings, client)
         posts = scraper.scrape()
         assert posts == []
 
-    def test_hit_url_fallback(self, settings, mock_client):
+    def test_failing_tag_does_not_drop_other_tags(self, settings):
+        """Tags are fetched concurrently; one failure leaves the rest intact."""
+        from radar.scraping.hackernews import HNScraper
+
+        ok_response = StubResponse(
+            {"hits": [{"objectID": "1", "title": "Show HN: x", "url": "https://ex.com/1"}]}
+        )
+
+        def fake_get(url, **kwargs):
+            if "ask_hn" in url:
+                raise Exception("Algolia timeout")
+            return ok_response
+
+        posts = HNScraper(settings, StubClient(fake_get)).fetch_raw()
+        assert [p.url for p in posts] == ["https://ex.com/1"]
+
+    def test_hit_url_fallback(self, settings):
         """When hit has no url, construct from objectID."""
         from radar.scraping.hackernews import HNScraper
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        client = serving({
             "hits": [
                 {
                     "objectID": "99999",
@@ -89,9 +136,8 @@ class TestHNScraper:
                     # No "url" key
                 }
             ]
-        }
-        mock_client.get.return_value = mock_response
-        scraper = HNScraper(settings, mock_client)
+        })
+        scraper = HNScraper(settings, client)
         posts = scraper.fetch_raw()
         assert len(posts) > 0
         assert "99999" in posts[0].url
@@ -103,11 +149,10 @@ class TestHNScraper:
 
 
 class TestDevToScraper:
-    def test_fetch_returns_raw_posts(self, settings, mock_client):
+    def test_fetch_returns_raw_posts(self, settings):
         from radar.scraping.devto import DevToScraper
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
+        client = serving([
             {
                 "id": 1001,
                 "title": "Why I Almost Quit OSS Maintenance",
@@ -120,10 +165,9 @@ class TestDevToScraper:
                 "published_at": "2024-01-15T10:00:00Z",
                 "tag_list": ["opensource", "burnout"],
             }
-        ]
-        mock_client.get.return_value = mock_response
+        ])
 
-        scraper = DevToScraper(settings, mock_client)
+        scraper = DevToScraper(settings, client)
         posts = scraper.fetch_raw()
 
         assert len(posts) > 0
@@ -132,7 +176,7 @@ class TestDevToScraper:
         assert post.upvotes == 200
         assert post.comments == 35
 
-    def test_dedup_across_tags(self, settings, mock_client):
+    def test_dedup_across_tags(self, settings):
         """Same article fetched for multiple tags is only included once."""
         from radar.scraping.devto import DevToScraper
 
@@ -147,20 +191,18 @@ class TestDevToScraper:
             "published_at": "2024-01-10T00:00:00Z",
             "tag_list": [],
         }
-        mock_response = MagicMock()
-        mock_response.json.return_value = [same_article]
-        mock_client.get.return_value = mock_response
+        client = serving([same_article])
 
-        scraper = DevToScraper(settings, mock_client)
+        scraper = DevToScraper(settings, client)
         posts = scraper.fetch_raw()
         urls = [p.url for p in posts]
         assert len(urls) == len(set(urls))
 
-    def test_scrape_isolates_errors(self, settings, mock_client):
+    def test_scrape_isolates_errors(self, settings):
         from radar.scraping.devto import DevToScraper
 
-        mock_client.get.side_effect = Exception("API error")
-        scraper = DevToScraper(settings, mock_client)
+        client = failing("API error")
+        scraper = DevToScraper(settings, client)
         posts = scraper.scrape()
         assert posts == []
 
@@ -171,11 +213,10 @@ class TestDevToScraper:
 
 
 class TestLobstersScraper:
-    def test_fetch_returns_raw_posts(self, settings, mock_client):
+    def test_fetch_returns_raw_posts(self, settings):
         from radar.scraping.lobsters import LobstersScraper
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
+        client = serving([
             {
                 "title": "OSS Maintainer Burnout Is Real",
                 "url": "https://example.com/burnout",
@@ -187,10 +228,9 @@ class TestLobstersScraper:
                 "tags": ["programming", "oss"],
                 "description": "A tale of CI failing forever",
             }
-        ]
-        mock_client.get.return_value = mock_response
+        ])
 
-        scraper = LobstersScraper(settings, mock_client)
+        scraper = LobstersScraper(settings, client)
         posts = scraper.fetch_raw()
 
         assert len(posts) > 0
@@ -198,15 +238,90 @@ class TestLobstersScraper:
         assert post.platform == "lobsters"
         assert post.upvotes == 45
 
-    def test_scrape_isolates_errors(self, settings, mock_client):
+    def test_scrape_isolates_errors(self, settings):
         from radar.scraping.lobsters import LobstersScraper
 
-        mock_client.get.side_effect = Exception("Feed error")
-        scraper = LobstersScraper(settings, mock_client)
+        client = failing("Feed error")
+        scraper = LobstersScraper(settings, client)
         posts = scraper.scrape()
         assert posts == []
 
 
+# ---------------------------------------------------------------------------
+# Reddit Scraper tests
+# ---------------------------------------------------------------------------
+
+
+class TestRedditScraper:
+    def test_submission_uses_batched_karma(self, settings):
+        from types import SimpleNamespace
+
+        from radar.scraping.reddit import RedditScraper
+
+        submission = SimpleNamespace(
+            url="https://example.com/x",
+            permalink="/r/opensource/comments/abc/title/",
+            title="I maintain a library and I'm burned out",
+            selftext="body",
+            author=SimpleNamespace(name="maint"),
+            author_fullname="t2_maint",
+            created_utc=1705312800,
+            link_flair_text="Discussion",
+            score=42,
+            num_comments=7,
+        )
+        scraper = RedditScraper(settings, MagicMock())
+        post = scraper._submission_to_post(submission, None, {"t2_maint": 1234})
+
+        assert post.url == "https://www.reddit.com/r/opensource/comments/abc/title/"
+        assert post.author == "maint"
+        assert post.author_karma == 1234
+        assert post.upvotes == 42
+        assert post.tags == ["Discussion"]
+
+    def test_author_karma_batches_and_skips_missing(self, settings):
+        """Karma resolves across 100-name pages; deleted/suspended authors are tolerated."""
+        from types import SimpleNamespace
+
+        from radar.scraping.reddit import RedditScraper
+
+        class StubRedditors:
+            """Mimics PRAW: one user_by_fullname request per 100 ids, unknown ids dropped."""
+
+            def __init__(self) -> None:
+                self.requests: list[list[str]] = []
+
+            def partial_redditors(self, ids):
+                ids = list(ids)
+                for start in range(0, len(ids), 100):
+                    page = ids[start:start + 100]
+                    self.requests.append(page)
+                    for fullname in page:
+                        if fullname == "t2_deleted":
+                            continue  # deleted accounts are absent from the response
+                        if fullname == "t2_suspended":
+                            # suspended accounts come back without karma fields
+                            yield SimpleNamespace(fullname=fullname, is_suspended=True)
+                            continue
+                        yield SimpleNamespace(fullname=fullname, link_karma=int(fullname[3:]))
+
+        fullnames = [f"t2_{i:03d}" for i in range(150)] + ["t2_deleted", "t2_suspended"]
+        submissions = [SimpleNamespace(author_fullname=name) for name in fullnames]
+        # Removed authors and duplicates must not add lookups
+        submissions += [SimpleNamespace(author=None), SimpleNamespace(author_fullname="t2_000")]
+        reddit = SimpleNamespace(redditors=StubRedditors())
+
+        karma = RedditScraper(settings, MagicMock())._fetch_author_karma(reddit, submissions)
+
+        assert [len(page) for page in reddit.redditors.requests] == [100, 52]
+        assert sorted(sum(reddit.redditors.requests, [])) == sorted(fullnames)
+        assert karma["t2_000"] == 0
+        assert karma["t2_149"] == 149
+        assert karma["t2_suspended"] == 0
+        assert "t2_deleted" not in karma
+        assert len(karma) == 151
+
+
 # ---------------------------------------------------------------------------
 # BaseScraper contract tests
 # ---------------------------------------------------------------------------
@@ -244,3 +359,107 @@ class TestBaseScraper:
         scraper.fetch_raw = lambda: (_ for _ in ()).throw(Exception("boom"))  # type: ignore[assignment]
         result = scraper.scrape()
         assert result == []
+
+    def test_scrapers_share_default_client(self):
+        """Scrapers built without a client reuse one pooled SafeHTTPClient."""
+        from radar.config import Settings
+        from radar.scraping.devto import DevToScraper
+        from radar.scraping.hackernews import HNScraper
+        from radar.scraping.http import get_default_client
+
+        settings = Settings(email_enabled=False, reddit_enabled=False)
+        hn = HNScraper(settings)
+        devto = DevToScraper(settings)
+        assert hn.client is devto.client
+        assert hn.client is get_default_client(settings)
+
+    def test_default_client_follows_http_settings(self):
+        """A Settings with a different timeout must not get the first client."""
+        from radar.config import Settings
+        from radar.scraping.http import get_default_client
+
+        fast = Settings(email_enabled=False, reddit_enabled=False, request_timeout=5)
+        slow = Settings(email_enabled=False, reddit_enabled=False, request_timeout=60)
+        assert get_default_client(fast) is not get_default_client(slow)
+        assert get_default_client(slow).timeout == 60
+        assert get_default_client(fast) is get_default_client(fast.model_copy())
+
+    def test_dedup_key_normalizes_case_and_whitespace(self):
+        from radar.config import Settings
+        from radar.scraping.hackernews import HNScraper
+
+        settings = Settings(email_enabled=False, reddit_enabled=False)
+        scraper = HNScraper(settings)
+        assert scraper._dedup_key("  HTTPS://Example.com/Post/ \n") == scraper._dedup_key(
+            "https://example.com/post"
+        )
+
+    @pytest.mark.parametrize(
+        "pad", [" ", "\t", "\n", "\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x1f"]
+    )
+    def test_dedup_key_matches_str_normalisation(self, pad):
+        """The ASCII bytes fast path hashes exactly what str.strip()/lower() did."""
+        import hashlib
+
+        from radar.models import _sha256_url
+
+        url = f"{pad}HTTPS://Example.com/Post/{pad}"
+        expected = hashlib.sha256(url.strip().lower().rstrip("/").encode()).hexdigest()
+        assert _sha256_url(url) == expected
+
+
+# ---------------------------------------------------------------------------
+# SafeHTTPClient SSRF checks
+# ---------------------------------------------------------------------------
+
+
+class TestSafeHTTPClient:
+    def test_dns_check_cached_per_host(self):
+        from radar.scraping.http import SafeHTTPClient
+
+        public = [(2, 1, 6, "", ("151.101.1.1", 0))]
+        with patch("socket.getaddrinfo", return_value=public) as mock_dns, \
+                SafeHTTPClient() as client:
+            client._assert_safe("https://hn.algolia.com/api/v1/search_by_date")
+            client._assert_safe("https://hn.algolia.com/api/v1/search?tags=ask_hn")
+            client._assert_safe("https://dev.to/api/articles")
+        assert [c.args[0] for c in mock_dns.call_args_list] == ["hn.algolia.com", "dev.to"]
+
+    def test_dns_check_repeats_after_ttl(self):
+        from radar.scraping.http import SafeHTTPClient, SSRFError
+
+        public = [(2, 1, 6, "", ("151.101.1.1", 0))]
+        private = [(2, 1, 6, "", ("10.0.0.5", 0))]
+        with SafeHTTPClient() as client:
+            with patch("socket.getaddrinfo", return_value=public):
+                client._assert_safe("https://lobste.rs/newest.json")
+            client._checked_hosts["lobste.rs"] = 0.0  # TTL elapsed
+            with patch("socket.getaddrinfo", return_value=private):
+                with pytest.raises(SSRFError):
+                    client._assert_safe("https://lobste.rs/newest.json")
+
+    def test_api_host_private_ip_blocked(self):
+        """Scraper API hosts get the same private-IP check as any other host."""
+        from radar.scraping.http import SafeHTTPClient, SSRFError
+
+        private = [(2, 1, 6, "", ("127.0.0.1", 0))]
+        with patch("socket.getaddrinfo", return_value=private), SafeHTTPClient() as client:
+            with pytest.raises(SSRFError):
+                client._assert_safe("https://hn.algolia.com/api/v1/search_by_date")
+            with pytest.raises(SSRFError):
+                client._assert_safe("https://hn.algolia.com/api/v1/search_by_date")
+
+    def test_unknown_host_private_ip_blocked(self):
+        from radar.scraping.http import SafeHTTPClient, SSRFError
+
+        private = [(2, 1, 6, "", ("10.0.0.5", 0))]
+        with patch("socket.getaddrinfo", return_value=private), SafeHTTPClient() as client:
+            with pytest.raises(SSRFError):
+                client._assert_safe("https://evil.example.com/")
+
+    def test_rejects_bad_scheme(self):
+        from radar.scraping.http import SafeHTTPClient, SSRFError
+
+        with SafeHTTPClient() as client:
+            with pytest.raises(SSRFError):
+                client._assert_safe("file://dev.to/etc/passwd")
@@ -65,6 +65,43 @@ class TestDatabaseInit:
         mode = tmp_db._conn.execute("PRAGMA journal_mode").fetchone()[0]
         assert mode == "wal"
 
+    def test_performance_pragmas_applied(self, tmp_db):
+        conn = tmp_db._conn
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 3000
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_mmap_enabled(self, tmp_db):
+        assert tmp_db._read_conn.execute("PRAGMA mmap_size").fetchone()[0] > 0
+
+    def test_reads_use_separate_connection(self, tmp_db):
+        assert tmp_db._read_conn is not tmp_db._conn
+        assert tmp_db._read_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # Committed writes are visible to the reader immediately.
+        tmp_db.upsert_post(make_scored_post(url="https://example.com/visible"))
+        assert tmp_db.get_stats()["post_count"] == 1
+
+    def test_unreported_partial_index_exists(self, tmp_db):
+        row = tmp_db._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'idx_posts_unreported'"
+        ).fetchone()
+        assert row is not None
+        assert "WHERE reported_at IS NULL" in row[0]
+
+    def test_fresh_catalog_not_analyzed(self, tmp_path):
+        """Stats of empty tables would mislead the planner; leave it to PRAGMA optimize."""
+        from radar.storage.database import Database
+
+        db = Database(str(tmp_path / "fresh.db"))
+        try:
+            row = db._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            assert row is None
+        finally:
+            db.close()
+
 
 class TestPostUpsert:
     def test_insert_new_post(self, tmp_db):
@@ -79,6 +116,19 @@ class TestPostUpsert:
         id2 = tmp_db.upsert_post(post)  # same url_hash
         assert id1 == id2  # returns existing row id
 
+    def test_insert_without_returning_support(self, tmp_db, monkeypatch):
+        """SQLite < 3.35 falls back to INSERT OR IGNORE and still reports row ids."""
+        monkeypatch.setattr(tmp_db, "_has_returning", False)
+        known = make_scored_post(url="https://example.com/known")
+        known_id = tmp_db.upsert_post(known)
+        new = make_scored_post(url="https://example.com/new")
+
+        new_id, again_id = tmp_db.upsert_posts([new, known])
+        assert again_id == known_id
+        assert new_id == tmp_db._conn.execute(
+            "SELECT id FROM posts WHERE url_hash = ?", (new.url_hash,)
+        ).fetchone()[0]
+
     def test_different_urls_both_inserted(self, tmp_db):
         post1 = make_scored_post(url="https://example.com/a")
         post2 = make_scored_post(url="https://example.com/b")
@@ -86,6 +136,19 @@ class TestPostUpsert:
         id2 = tmp_db.upsert_post(post2)
         assert id1 != id2
 
+    def test_upsert_posts_batch_returns_ids_in_order(self, tmp_db):
+        existing_id = tmp_db.upsert_post(make_scored_post(url="https://example.com/old"))
+        posts = [
+            make_scored_post(url="https://example.com/new1"),
+            make_scored_post(url="https://example.com/old"),
+            make_scored_post(url="https://example.com/new2"),
+        ]
+        ids = tmp_db.upsert_posts(posts)
+        assert len(ids) == 3
+        assert ids[1] == existing_id
+        assert len(set(ids)) == 3
+        assert tmp_db.get_stats()["post_count"] == 3
+
     def test_pain_categories_serialised(self, tmp_db):
         post = make_scored_post(
             url="https://example.com/cats",
@@ -131,6 +194,23 @@ class TestReportCrud:
         assert row is not None
         assert row["rank"] == 1
 
+    def test_add_report_entries_batch_ignores_existing(self, tmp_db):
+        ids = tmp_db.upsert_posts(
+            [make_scored_post(url=f"https://example.com/e{i}") for i in range(3)]
+        )
+        report_id = tmp_db.create_report("daily", "2024-01-18")
+        tmp_db.add_report_entry(report_id=report_id, post_id=ids[0], rank=1)
+        tmp_db.add_report_entries(
+            report_id, [(pid, rank, "live") for rank, pid in enumerate(ids, start=1)]
+        )
+        rows = tmp_db._conn.execute(
+            "SELECT post_id, rank FROM report_entries WHERE report_id=? ORDER BY rank",
+            (report_id,),
+        ).fetchall()
+        assert [(r["post_id"], r["rank"]) for r in rows] == [
+            (pid, rank) for rank, pid in enumerate(ids, start=1)
+        ]
+
 
 class TestDuplicateRunCheck:
     def test_no_recent_report_returns_false(self, tmp_db):
@@ -154,6 +234,12 @@ class TestFetchArchive:
         results = tmp_db.fetch_archive(days=7, limit=10)
         assert len(results) == 1
 
+    def test_unparseable_scraped_at_falls_back_to_aware_now(self, tmp_db):
+        post_id = tmp_db.upsert_post(make_scored_post(url="https://example.com/bad-ts"))
+        tmp_db._conn.execute("UPDATE posts SET scraped_at = 'garbage' WHERE id = ?", (post_id,))
+        (result,) = tmp_db.fetch_all_unreported(limit=10)
+        assert result.scraped_at.tzinfo is not None
+
     def test_reported_posts_excluded(self, tmp_db):
         post = make_scored_post(url="https://example.com/reported")
         post_id = tmp_db.upsert_post(post)
@@ -171,6 +257,67 @@ class TestFetchArchive:
         scores = [r.signal_score for r in results]
         assert scores == sorted(scores, reverse=True)
 
+    def test_round_trip_preserves_fields(self, tmp_db):
+        post = make_scored_post(
+            url="https://example.com/roundtrip",
+            pain_categories=[PainCategory.BURNOUT, PainCategory.CI_CD],
+        )
+        tmp_db.upsert_post(post)
+        bare = make_scored_post(url="https://example.com/bare", pain_categories=[])
+        tmp_db.upsert_post(bare)
+
+        by_url = {r.url: r for r in tmp_db.fetch_archive(days=7, limit=10)}
+        got = by_url["https://example.com/roundtrip"]
+        assert got.url_hash == post.url_hash
+        assert got.pain_categories == [PainCategory.BURNOUT, PainCategory.CI_CD]
+        assert got.followers == got.author_karma == 500
+        assert got.comments == got.comment_count == 20
+        assert got.maintainer_boost == 1.25
+        assert got.is_maintainer is True
+        assert by_url["https://example.com/bare"].pain_categories == []
+        assert by_url["https://example.com/bare"].tags == []
+
+    def test_unknown_pain_category_dropped(self, tmp_db):
+        post = make_scored_post(url="https://example.com/legacy")
+        tmp_db.upsert_post(post)
+        tmp_db._conn.execute(
+            "UPDATE posts SET pain_categories = ? WHERE url_hash = ?",
+            ('["burnout", "retired_category"]', post.url_hash),
+        )
+        [got] = tmp_db.fetch_archive(days=7, limit=10)
+        assert got.pain_categories == [PainCategory.BURNOUT]
+
+    def test_minimal_fetch_then_hydrate_by_ids(self, tmp_db):
+        for i, score in enumerate([0.2, 0.8, 0.5]):
+            p = make_scored_post(url=f"https://example.com/m{i}", signal_score=score)
+            tmp_db.upsert_post(p)
+
+        top = tmp_db.fetch_top_unreported_minimal(limit=2)
+        assert [score for _, _, score in top] == [0.8, 0.5]
+
+        ids = [post_id for post_id, _, _ in reversed(top)]
+        hydrated = tmp_db.fetch_posts_by_ids(ids)
+        assert [p.url for p in hydrated] == [
+            "https://example.com/m2", "https://example.com/m1"
+        ]
+        assert tmp_db.fetch_posts_by_ids([]) == []
+
+
+class TestWeeklyPosts:
+    def test_only_linked_posts_returned_once(self, tmp_db):
+        linked = tmp_db.upsert_post(make_scored_post(url="https://example.com/linked"))
+        orphan = tmp_db.upsert_post(make_scored_post(url="https://example.com/orphan"))
+        for day in ("2024-01-15", "2024-01-16"):
+            report_id = tmp_db.create_report("daily", day)
+            tmp_db.add_report_entry(report_id=report_id, post_id=linked, rank=1)
+        tmp_db.mark_reported(linked)
+        tmp_db.mark_reported(orphan)
+
+        start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2100, 1, 1, tzinfo=timezone.utc)
+        results = tmp_db.get_weekly_posts(start, end)
+        assert [r.url for r in results] == ["https://example.com/linked"]
+
 
 class TestStats:
     def test_initial_stats_zero(self, tmp_db):
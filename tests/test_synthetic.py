@@ -2,8 +2,39 @@
 
 from __future__ import annotations
 
-from radar.models import PainCategory, RawPost
-from radar.synthetic import PLATFORMS, SyntheticDataGenerator
+from collections import Counter
+from operator import attrgetter
+
+import pytest
+
+from radar.models import PainCategory, RawPost, ScoredPost
+from radar.ranking.filters import FilterPipeline
+from radar.ranking.keywords import MAINTAINER_FUSED, count_keyword_hits
+from radar.ranking.scorer import SignalScorer
+from radar.synthetic import _READABLE_KEYWORDS, PLATFORMS, SyntheticDataGenerator, _readable
+
+
+@pytest.fixture(scope="module")
+def synthetic_50() -> tuple[RawPost, ...]:
+    """The ``count=50, seed=42`` batch, generated once per module.
+
+    Generation is deterministic, so every test sees identical posts; tests
+    that run filters on them work on copies.
+    """
+    return tuple(SyntheticDataGenerator(count=50, seed=42).generate())
+
+
+@pytest.fixture(scope="module")
+def synthetic_50_texts(synthetic_50) -> tuple[str, ...]:
+    """The ``title body`` text the filters scan, built once per post."""
+    return tuple(f"{p.title} {p.body}" for p in synthetic_50)
+
+
+@pytest.fixture(scope="module")
+def scored_30() -> tuple[list[RawPost], list[ScoredPost]]:
+    """Filter and score the ``count=30, seed=42`` batch once per module."""
+    filtered = FilterPipeline().apply(SyntheticDataGenerator(count=30, seed=42).generate())
+    return filtered, SignalScorer().score_batch(filtered)
 
 
 class TestGeneratorOutput:
@@ -42,12 +73,10 @@ class TestPlatformSpread:
     def test_platform_distribution_roughly_even(self) -> None:
         gen = SyntheticDataGenerator(count=100, seed=1)
         posts = gen.generate()
-        counts = {}
-        for p in posts:
-            counts[p.platform] = counts.get(p.platform, 0) + 1
+        counts = Counter(p.platform for p in posts)
         # Each platform should have at least 20% of posts
         for plat in PLATFORMS:
-            assert counts.get(plat, 0) >= 20, f"{plat} only got {counts.get(plat, 0)}"
+            assert counts[plat] >= 20, f"{plat} only got {counts[plat]}"
 
 
 class TestDeterministicSeeding:
@@ -56,13 +85,9 @@ class TestDeterministicSeeding:
     def test_same_seed_same_output(self) -> None:
         gen1 = SyntheticDataGenerator(count=20, seed=42)
         gen2 = SyntheticDataGenerator(count=20, seed=42)
-        posts1 = gen1.generate()
-        posts2 = gen2.generate()
-        for p1, p2 in zip(posts1, posts2):
-            assert p1.url == p2.url
-            assert p1.title == p2.title
-            assert p1.body == p2.body
-            assert p1.platform == p2.platform
+        # scraped_at is a wall-clock timestamp, so compare the seeded fields only
+        key = attrgetter("url", "title", "body", "platform")
+        assert list(map(key, gen1.generate())) == list(map(key, gen2.generate()))
 
     def test_different_seeds_different_output(self) -> None:
         gen1 = SyntheticDataGenerator(count=10, seed=1)
@@ -81,73 +106,73 @@ class TestPostFields:
     def test_urls_are_unique(self) -> None:
         gen = SyntheticDataGenerator(count=50, seed=7)
         posts = gen.generate()
-        urls = [p.url for p in posts]
-        assert len(urls) == len(set(urls))
+        assert len({p.url for p in posts}) == len(posts)
 
-    def test_url_hashes_populated(self) -> None:
-        gen = SyntheticDataGenerator(count=5, seed=7)
-        posts = gen.generate()
-        for p in posts:
-            assert p.url_hash, f"url_hash empty for {p.url}"
-            assert len(p.url_hash) == 64  # SHA-256 hex
+    def test_url_hashes_populated(self, synthetic_50) -> None:
+        # A SHA-256 digest renders as 64 chars, which also rules out ""
+        bad = [p.url for p in synthetic_50 if len(p.url_hash) != 64]
+        assert not bad, f"url_hash missing or not 64 chars for {bad}"
 
-    def test_engagement_metrics_positive(self) -> None:
-        gen = SyntheticDataGenerator(count=20, seed=3)
-        posts = gen.generate()
-        for p in posts:
+    def test_engagement_metrics_positive(self, synthetic_50) -> None:
+        for p in synthetic_50:
             assert p.followers >= 0
             assert p.upvotes >= 0
             assert p.comments >= 0
 
-    def test_authors_populated(self) -> None:
-        gen = SyntheticDataGenerator(count=10, seed=5)
-        posts = gen.generate()
-        for p in posts:
-            assert p.author
+    def test_authors_populated(self, synthetic_50) -> None:
+        bad = [p.url for p in synthetic_50 if not p.author]
+        assert not bad, f"author missing for {bad}"
 
-    def test_scraped_at_populated(self) -> None:
-        gen = SyntheticDataGenerator(count=5, seed=5)
-        posts = gen.generate()
-        for p in posts:
-            assert p.scraped_at is not None
+    def test_scraped_at_populated(self, synthetic_50) -> None:
+        bad = [p.url for p in synthetic_50 if p.scraped_at is None]
+        assert not bad, f"scraped_at missing for {bad}"
+
+    def test_timestamps_timezone_aware(self, synthetic_50) -> None:
+        # Scrapers stamp aware UTC times; naive ones would break sorting a mix
+        defaulted = RawPost(url="https://example.com/x", title="t", platform="hackernews")
+        posts = [*synthetic_50, defaulted]
+        bad = [p.url for p in posts if p.scraped_at.tzinfo is None]
+        assert not bad, f"naive scraped_at for {bad}"
+        bad = [p.url for p in synthetic_50 if p.created_utc.tzinfo is None]
+        assert not bad, f"naive created_utc for {bad}"
+        sorted(posts, key=attrgetter("scraped_at"))
+
+
+class TestReadableKeywords:
+    """Regex patterns are rendered to plain phrases for post bodies."""
+
+    def test_metacharacters_stripped(self) -> None:
+        assert _readable(r"\bburned?\s+out\b") == "burned out"
+        assert _readable(r"\bCVE-\d{4}") == "CVE-2026"
+        assert _readable(r"\bci[/ _-]cd\b") == "ci cd"
+
+    def test_every_category_has_phrases(self) -> None:
+        for phrases in _READABLE_KEYWORDS.values():
+            assert phrases
+            assert all("\\" not in p for p in phrases)
 
 
 class TestFilterCalibration:
     """Posts should be calibrated to the real filter pipeline."""
 
-    def test_some_posts_have_pain_keywords(self) -> None:
+    def test_some_posts_have_pain_keywords(self, synthetic_50_texts) -> None:
         """At least some posts should trigger keyword detection."""
-        from radar.ranking.keywords import count_keyword_hits
-
-        gen = SyntheticDataGenerator(count=50, seed=42)
-        posts = gen.generate()
-        hits = sum(
-            1 for p in posts
-            if count_keyword_hits(f"{p.title} {p.body}")
-        )
+        hits = sum(bool(count_keyword_hits(text)) for text in synthetic_50_texts)
         # At least 40% should have pain keywords (60% designed to pass + some non-maintainer)
         assert hits >= 20, f"Only {hits}/50 posts had pain keywords"
 
-    def test_some_posts_have_maintainer_context(self) -> None:
+    def test_some_posts_have_maintainer_context(self, synthetic_50_texts) -> None:
         """At least some posts should have maintainer-context patterns."""
-        from radar.ranking.keywords import MAINTAINER_PATTERNS
-
-        gen = SyntheticDataGenerator(count=50, seed=42)
-        posts = gen.generate()
-        maintainer_hits = 0
-        for p in posts:
-            text = f"{p.title} {p.body}"
-            if any(pat.search(text) for pat in MAINTAINER_PATTERNS):
-                maintainer_hits += 1
+        maintainer_hits = sum(
+            MAINTAINER_FUSED.search(text) is not None for text in synthetic_50_texts
+        )
         # ~60% designed to be maintainer posts
         assert maintainer_hits >= 15, f"Only {maintainer_hits}/50 had maintainer context"
 
-    def test_mix_of_passing_and_failing_posts(self) -> None:
+    def test_mix_of_passing_and_failing_posts(self, synthetic_50) -> None:
         """Not all posts should pass all filters — some should be noise."""
-        from radar.ranking.filters import FilterPipeline
-
-        gen = SyntheticDataGenerator(count=50, seed=42)
-        posts = gen.generate()
+        # The filters set attributes on the posts they see; keep the shared batch clean.
+        posts = [p.model_copy() for p in synthetic_50]
         pipeline = FilterPipeline()
         filtered = pipeline.apply(posts)
         # Some pass, some don't — not 100% and not 0%
@@ -159,39 +184,21 @@ class TestFilterCalibration:
 class TestPipelineIntegration:
     """Synthetic data should work through the full ranking pipeline."""
 
-    def test_score_batch_succeeds(self) -> None:
-        from radar.ranking.filters import FilterPipeline
-        from radar.ranking.scorer import SignalScorer
-
-        gen = SyntheticDataGenerator(count=30, seed=42)
-        posts = gen.generate()
-
-        filtered = FilterPipeline().apply(posts)
+    def test_score_batch_succeeds(self, scored_30) -> None:
+        filtered, scored = scored_30
         assert len(filtered) > 0, "No posts passed filters"
 
-        scorer = SignalScorer()
-        scored = scorer.score_batch(filtered)
         assert len(scored) > 0
         # Scores should be positive
         for s in scored:
             assert s.final_score >= 0 or s.signal_score >= 0
 
-    def test_end_to_end_with_storage(self, tmp_path) -> None:
+    def test_end_to_end_with_storage(self, tmp_db, scored_30) -> None:
         """Full round-trip: generate → filter → score → store → retrieve."""
-        from radar.ranking.filters import FilterPipeline
-        from radar.ranking.scorer import SignalScorer
-        from radar.storage.database import Database
-
-        db_path = str(tmp_path / "test_synth.db")
-        db = Database(db_path)
-
-        gen = SyntheticDataGenerator(count=30, seed=42)
-        posts = gen.generate()
-        filtered = FilterPipeline().apply(posts)
-        scored = SignalScorer().score_batch(filtered)
+        _, scored = scored_30
 
         for post in scored[:5]:
-            db.upsert_post(post)
+            tmp_db.upsert_post(post)
 
-        stats = db.get_stats()
+        stats = tmp_db.get_stats()
         assert stats.get("post_count", 0) >= 1